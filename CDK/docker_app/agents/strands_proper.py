@@ -3,9 +3,12 @@
 strands-agents-example.md의 실제 문법을 따름
 """
 
+import asyncio
 import json
+import re
 import time
 import boto3
+from functools import lru_cache
 from botocore.config import Config
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, List, Any, Optional
@@ -29,6 +32,90 @@ from utils.config import AgentConfig
 from utils.kb_search import KnowledgeBaseSearcher
 from utils.bedrock_client import BedrockClient
 
+# orjson이 설치된 경우 선택적으로 사용 (C 구현 JSON 인코더, 3-10배 빠름)
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    _loads = json.loads
+
+# 내용이 고정된 오류 응답은 모듈 로드 시 1회만 직렬화
+_ERR_NO_KB = _dumps({
+    "success": False,
+    "error": "Knowledge Base가 설정되지 않았습니다.",
+    "results": []
+})
+_ERR_KB_TIMEOUT = _dumps({
+    "success": False,
+    "error": "KB 검색 시간 초과. 네트워크 연결을 확인하거나 잠시 후 다시 시도해주세요.",
+    "error_type": "timeout",
+    "results": []
+})
+_ERR_SYSTEM_TIMEOUT = _dumps({
+    "success": False,
+    "error": "시스템 타임아웃이 발생했습니다. 잠시 후 다시 시도해주세요.",
+    "error_type": "system_timeout",
+    "results": []
+})
+# quality_assessor의 "결과 없음" 응답 2종 (needs_retry 여부로 인덱싱)
+_QA_EMPTY = (
+    _dumps({"quality_score": 0.0, "needs_retry": False, "is_sufficient": False, "reason": "검색 결과 없음"}),
+    _dumps({"quality_score": 0.0, "needs_retry": True, "is_sufficient": False, "reason": "검색 결과 없음"}),
+)
+_ERR_TIMEOUT_45 = _dumps({
+    "success": False,
+    "error": "KB 검색 시간 초과 (45초). 네트워크 상태를 확인하거나 잠시 후 다시 시도해주세요.",
+    "error_type": "timeout",
+    "results": [],
+    "timeout_seconds": 45
+})
+
+# 인사말/연속성 질문 판별 패턴 (모듈 로드 시 1회 컴파일)
+_GREETING_RE = re.compile(r"안녕|hello|hi", re.IGNORECASE)
+_CONTINUATION_RE = re.compile(r"다음|그럼|계속")
+
+# KB 검색용 공유 스레드 풀 (호출마다 풀을 새로 만들지 않도록 모듈 레벨에서 1회 생성)
+_KB_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="kb-search")
+
+# KB 검색 결과 단기 캐시 (동일 키워드가 대화 중 반복될 때 네트워크 호출 생략)
+_KB_CACHE: Dict[tuple, tuple] = {}
+_KB_CACHE_TTL = 30.0  # KB 내용은 천천히 변하므로 30초면 충분
+_KB_CACHE_MAX = 128
+_KB_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+@lru_cache(maxsize=1)
+def _get_kb_searcher() -> KnowledgeBaseSearcher:
+    """KnowledgeBaseSearcher 싱글톤 (boto3 클라이언트 생성 비용 1회만 지불)"""
+    return KnowledgeBaseSearcher()
+
+
+def _kb_cache_get(key: tuple) -> Optional[str]:
+    """TTL이 지나지 않은 캐시 항목 반환 (없으면 None)"""
+    entry = _KB_CACHE.get(key)
+    if entry is not None:
+        if time.time() - entry[0] < _KB_CACHE_TTL:
+            _KB_CACHE_STATS["hits"] += 1
+            return entry[1]
+        _KB_CACHE.pop(key, None)
+    _KB_CACHE_STATS["misses"] += 1
+    return None
+
+
+def _kb_cache_put(key: tuple, value: str) -> None:
+    """캐시에 저장 (가장 오래된 항목부터 제거)"""
+    if len(_KB_CACHE) >= _KB_CACHE_MAX:
+        oldest = min(_KB_CACHE, key=lambda k: _KB_CACHE[k][0])
+        _KB_CACHE.pop(oldest, None)
+    _KB_CACHE[key] = (time.time(), value)
+
 
 # 실제 Strands 문법에 맞는 도구 정의 (모듈 레벨)
 @tool
@@ -46,20 +133,21 @@ def kb_search_tool(keywords: List[str], max_results: int = 5) -> str:
     try:
         # 전역 설정에서 KB 정보 가져오기 (실제 구현에서는 다른 방식 사용)
         if not hasattr(kb_search_tool, '_config') or not kb_search_tool._config.is_kb_enabled():
-            return json.dumps({
-                "success": False,
-                "error": "Knowledge Base가 설정되지 않았습니다.",
-                "results": []
-            })
+            return _ERR_NO_KB
         
         config = kb_search_tool._config
-        
+
+        # 캐시 확인 (동일 키워드 조합이면 재검색 생략)
+        cache_key = (config.kb_id, tuple(sorted(keywords)), max_results)
+        cached = _kb_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         # KB 검색기 초기화 (타임아웃 처리 포함)
         try:
-            from utils.kb_search import KnowledgeBaseSearcher
-            kb_searcher = KnowledgeBaseSearcher()
+            kb_searcher = _get_kb_searcher()
         except Exception as init_error:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": f"KB 검색기 초기화 실패: {str(init_error)}",
                 "results": []
@@ -76,14 +164,9 @@ def kb_search_tool(keywords: List[str], max_results: int = 5) -> str:
             # 검색 실패 시 상세 오류 정보 제공
             error_msg = str(search_error)
             if "timeout" in error_msg.lower() or "read timed out" in error_msg.lower():
-                return json.dumps({
-                    "success": False,
-                    "error": "KB 검색 시간 초과. 네트워크 연결을 확인하거나 잠시 후 다시 시도해주세요.",
-                    "error_type": "timeout",
-                    "results": []
-                })
+                return _ERR_KB_TIMEOUT
             else:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "error": f"KB 검색 실패: {error_msg}",
                     "error_type": "search_error",
@@ -101,25 +184,22 @@ def kb_search_tool(keywords: List[str], max_results: int = 5) -> str:
                 "query": result.get("query", "")
             })
         
-        return json.dumps({
+        result_json = _dumps({
             "success": True,
             "results_count": len(formatted_results),
             "results": formatted_results,
             "search_keywords": keywords
         })
-        
+        _kb_cache_put(cache_key, result_json)  # 성공 결과만 캐시
+        return result_json
+
     except Exception as e:
         # 최종 예외 처리
         error_msg = str(e)
         if "timeout" in error_msg.lower():
-            return json.dumps({
-                "success": False,
-                "error": "시스템 타임아웃이 발생했습니다. 잠시 후 다시 시도해주세요.",
-                "error_type": "system_timeout",
-                "results": []
-            })
+            return _ERR_SYSTEM_TIMEOUT
         else:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": f"KB 검색 중 예상치 못한 오류: {error_msg}",
                 "error_type": "unexpected_error",
@@ -131,23 +211,29 @@ def kb_search_tool(keywords: List[str], max_results: int = 5) -> str:
 def context_analyzer(query: str, history_json: str = "[]") -> str:
     """
     대화 맥락을 분석하여 질문의 성격을 파악합니다.
-    
+
     Args:
         query: 현재 사용자 질문
         history_json: 대화 히스토리 (JSON 문자열)
-        
+
     Returns:
         분석 결과를 JSON 문자열로 반환
     """
+    return _context_analyzer_cached(query, history_json)
+
+
+@lru_cache(maxsize=1024)
+def _context_analyzer_cached(query: str, history_json: str) -> str:
+    """context_analyzer 구현부 (결정적이므로 lru_cache 적용)"""
     try:
         # JSON 문자열을 파싱
-        history = json.loads(history_json) if history_json else []
+        history = _loads(history_json) if history_json else []
         
-        # 간단한 맥락 분석
-        is_greeting = any(word in query.lower() for word in ["안녕", "hello", "hi"])
-        is_continuation = any(word in query.lower() for word in ["다음", "그럼", "계속"])
+        # 간단한 맥락 분석 (컴파일된 패턴으로 단일 스캔)
+        is_greeting = bool(_GREETING_RE.search(query))
+        is_continuation = bool(_CONTINUATION_RE.search(query))
         
-        return json.dumps({
+        return _dumps({
             "is_greeting": is_greeting,
             "is_continuation": is_continuation,
             "has_context": len(history) > 0,
@@ -155,7 +241,7 @@ def context_analyzer(query: str, history_json: str = "[]") -> str:
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": str(e),
             "is_greeting": False,
             "is_continuation": False,
@@ -177,21 +263,20 @@ def quality_assessor(search_results_json: str, iteration: int = 1) -> str:
         품질 평가 결과를 JSON 문자열로 반환
     """
     try:
-        search_results = json.loads(search_results_json) if search_results_json else []
+        search_results = _loads(search_results_json) if search_results_json else []
         
         if not search_results:
-            return json.dumps({
-                "quality_score": 0.0,
-                "needs_retry": iteration < 3,
-                "is_sufficient": False,
-                "reason": "검색 결과 없음"
-            })
-        
-        # 간단한 품질 평가
-        avg_score = sum(r.get("score", 0) for r in search_results) / len(search_results)
+            # 미리 직렬화된 응답을 needs_retry 여부로 인덱싱 (분기/인코딩 없음)
+            return _QA_EMPTY[iteration < 3]
+        
+        # 간단한 품질 평가 (단일 패스 누적, 제너레이터 할당 없음)
+        total_score = 0.0
+        for r in search_results:
+            total_score += r.get("score", 0)
+        avg_score = total_score / len(search_results)
         is_sufficient = avg_score > 0.5 or iteration >= 3
         
-        return json.dumps({
+        return _dumps({
             "quality_score": avg_score,
             "needs_retry": not is_sufficient,
             "is_sufficient": is_sufficient,
@@ -199,7 +284,7 @@ def quality_assessor(search_results_json: str, iteration: int = 1) -> str:
         })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "quality_score": 0.0,
             "needs_retry": False,
             "is_sufficient": True,
@@ -207,53 +292,44 @@ def quality_assessor(search_results_json: str, iteration: int = 1) -> str:
         })
 
 
-@tool
-def timeout_resilient_kb_search(keywords: List[str], max_results: int = 5) -> str:
+async def kb_search_tool_async(keywords: List[str], max_results: int = 5, timeout_seconds: float = 45) -> str:
     """
-    타임아웃에 강화된 Knowledge Base 검색 도구
-    
+    kb_search_tool의 비동기 래퍼
+
+    이벤트 루프 위에서 실행 중인 호출자를 위해 블로킹 검색을 공유 스레드 풀로
+    넘기고 asyncio.wait_for로 타임아웃을 적용합니다.
+
     Args:
         keywords: 검색할 키워드 리스트
         max_results: 최대 결과 수
-        
+        timeout_seconds: 타임아웃 (초)
+
     Returns:
         검색 결과를 JSON 문자열로 반환
     """
+    loop = asyncio.get_running_loop()
     try:
-        # ThreadPoolExecutor를 사용한 타임아웃 처리
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(kb_search_tool, keywords, max_results)
-            try:
-                # 45초 타임아웃으로 검색 실행
-                result = future.result(timeout=45)
-                return result
-            except FutureTimeoutError:
-                # 타임아웃 발생 시 안전한 응답 반환
-                return json.dumps({
-                    "success": False,
-                    "error": "KB 검색 시간 초과 (45초). 네트워크 상태를 확인하거나 잠시 후 다시 시도해주세요.",
-                    "error_type": "timeout",
-                    "results": [],
-                    "timeout_seconds": 45
-                })
-    except Exception as e:
-        return json.dumps({
+        return await asyncio.wait_for(
+            loop.run_in_executor(_KB_EXECUTOR, kb_search_tool, keywords, max_results),
+            timeout=timeout_seconds
+        )
+    except asyncio.TimeoutError:
+        return _dumps({
             "success": False,
-            "error": f"타임아웃 강화 KB 검색 실패: {str(e)}",
-            "error_type": "system_error",
+            "error": f"KB 검색 시간 초과 ({timeout_seconds:.0f}초). 잠시 후 다시 시도해주세요.",
+            "error_type": "timeout",
             "results": []
         })
 
 
-def create_timeout_configured_bedrock_model(model_id: str, region: str = "us-west-2"):
-    """타임아웃이 설정된 Bedrock 모델 생성"""
-    if not STRANDS_AVAILABLE:
-        return None
-    
-    try:
-        from strands.models import BedrockModel
-        
-        # 타임아웃 설정이 포함된 boto3 config
+# 리전별 bedrock-runtime 클라이언트 풀 (TLS 핸드셰이크/자격 증명 해석 1회만 수행)
+_BEDROCK_CLIENTS: Dict[str, Any] = {}
+
+
+def _get_bedrock_runtime_client(region: str):
+    """타임아웃이 설정된 bedrock-runtime 클라이언트 반환 (리전별 캐시)"""
+    client = _BEDROCK_CLIENTS.get(region)
+    if client is None:
         timeout_config = Config(
             read_timeout=120,  # 읽기 타임아웃 120초
             connect_timeout=60,  # 연결 타임아웃 60초
@@ -263,10 +339,22 @@ def create_timeout_configured_bedrock_model(model_id: str, region: str = "us-wes
             },
             region_name=region
         )
-        
-        # 커스텀 boto3 클라이언트 생성
-        bedrock_client = boto3.client('bedrock-runtime', config=timeout_config)
-        
+        client = boto3.client('bedrock-runtime', config=timeout_config)
+        _BEDROCK_CLIENTS[region] = client
+    return client
+
+
+def create_timeout_configured_bedrock_model(model_id: str, region: str = "us-west-2"):
+    """타임아웃이 설정된 Bedrock 모델 생성"""
+    if not STRANDS_AVAILABLE:
+        return None
+
+    try:
+        from strands.models import BedrockModel
+
+        # 커스텀 boto3 클라이언트 (리전별 캐시 재사용)
+        bedrock_client = _get_bedrock_runtime_client(region)
+
         # BedrockModel에 커스텀 클라이언트 전달
         # 주의: 이 방법이 작동하지 않으면 환경변수로 타임아웃 설정
         model = BedrockModel(
@@ -305,6 +393,52 @@ def configure_boto3_timeouts():
 configure_boto3_timeouts()
 
 
+# Mock agent 호출용 프롬프트 템플릿 (모듈 레벨 상수)
+_MOCK_PROMPT_TMPL = """사용자 질문을 처리해주세요:
+
+질문: {query}
+대화 히스토리: {history}"""
+
+
+# 예외 발생 시 사용자 안내 템플릿 (모듈 레벨 상수)
+_EXCEPTION_FALLBACK_TMPL = """죄송합니다. 요청을 처리하는 중 문제가 발생했습니다.
+
+**질문:** {query}
+
+**문제:** 시스템 오류가 발생했습니다.
+
+**해결 방법:**
+1. 잠시 후 다시 시도해 주세요
+2. 질문을 더 간단하게 바꿔서 시도해 보세요
+3. 문제가 지속되면 관리자에게 문의하세요
+
+**오류 정보:** {error}"""
+
+
+# Agent 생성자가 system_prompt/tools 키워드를 지원하는지 1회만 감지해 캐시
+_AGENT_CTOR_SUPPORTS_TOOLS = None
+
+
+def _construct_agent(config: AgentConfig, system_prompt: str, tools: List[Any]) -> Agent:
+    """Agent 생성 (생성자 시그니처 호환성은 최초 1회만 try/except로 감지)"""
+    global _AGENT_CTOR_SUPPORTS_TOOLS
+
+    if not STRANDS_AVAILABLE or _AGENT_CTOR_SUPPORTS_TOOLS is False:
+        # Enhanced Mock Agent는 config만 받음
+        return Agent(config=config)
+
+    try:
+        agent = Agent(system_prompt=system_prompt, tools=tools)
+        _AGENT_CTOR_SUPPORTS_TOOLS = True
+        return agent
+    except TypeError as e:
+        if "unexpected keyword argument" in str(e):
+            print("⚠️ 실제 Strands Agent는 해당 파라미터를 지원하지 않음. Enhanced Mock으로 전환...")
+            _AGENT_CTOR_SUPPORTS_TOOLS = False
+            return Agent(config=config)
+        raise
+
+
 class ProperStrandsReActChatbot:
     """
     실제 Strands Agents 문법에 맞는 ReAct 챗봇
@@ -326,10 +460,24 @@ class ProperStrandsReActChatbot:
         
         # 실제 Strands 문법에 맞는 에이전트 생성
         self.main_agent = self._create_main_agent()
-        
-        # 전문 에이전트들 생성 (실제 Strands 패턴)
-        self.kb_search_agent = self._create_kb_search_agent()
-        self.context_agent = self._create_context_agent()
+
+        # 전문 에이전트들은 실제 사용 시점에 생성 (대부분의 쿼리는 main_agent만 사용)
+        self._kb_search_agent = None
+        self._context_agent = None
+
+    @property
+    def kb_search_agent(self) -> Agent:
+        """KB 검색 전문 에이전트 (지연 생성)"""
+        if self._kb_search_agent is None:
+            self._kb_search_agent = self._create_kb_search_agent()
+        return self._kb_search_agent
+
+    @property
+    def context_agent(self) -> Agent:
+        """대화 맥락 분석 전문 에이전트 (지연 생성)"""
+        if self._context_agent is None:
+            self._context_agent = self._create_context_agent()
+        return self._context_agent
     
     def _create_main_agent(self) -> Agent:
         """메인 오케스트레이터 에이전트 생성 (실제 Strands 문법)"""
@@ -362,23 +510,7 @@ class ProperStrandsReActChatbot:
         if calculator and STRANDS_AVAILABLE:
             available_tools.append(calculator)
         
-        if STRANDS_AVAILABLE:
-            # 실제 Strands Agent는 config 파라미터를 받지 않음
-            try:
-                return Agent(
-                    system_prompt=system_prompt,
-                    tools=available_tools
-                )
-            except TypeError as e:
-                if "unexpected keyword argument 'config'" in str(e):
-                    print("⚠️ 실제 Strands Agent는 config 파라미터를 지원하지 않음. Enhanced Mock으로 전환...")
-                    # Enhanced Mock Agent 사용
-                    return Agent(config=self.config)
-                else:
-                    raise e
-        else:
-            # Enhanced Mock Agent는 config만 받음
-            return Agent(config=self.config)
+        return _construct_agent(self.config, system_prompt, available_tools)
     
     def _create_kb_search_agent(self) -> Agent:
         """KB 검색 전문 에이전트 (실제 Strands 문법)"""
@@ -391,20 +523,8 @@ class ProperStrandsReActChatbot:
 
 kb_search_tool과 quality_assessor를 사용하여 효과적인 검색을 수행하세요."""
         
-        if STRANDS_AVAILABLE:
-            try:
-                return Agent(
-                    system_prompt=system_prompt,
-                    tools=[timeout_resilient_kb_search, quality_assessor] if self.config.is_kb_enabled() else []
-                )
-            except TypeError as e:
-                if "unexpected keyword argument" in str(e):
-                    # Enhanced Mock Agent 사용
-                    return Agent(config=self.config)
-                else:
-                    raise e
-        else:
-            return Agent(config=self.config)
+        tools = [timeout_resilient_kb_search, quality_assessor] if self.config.is_kb_enabled() else []
+        return _construct_agent(self.config, system_prompt, tools)
     
     def _create_context_agent(self) -> Agent:
         """대화 맥락 분석 전문 에이전트 (실제 Strands 문법)"""
@@ -413,20 +533,7 @@ kb_search_tool과 quality_assessor를 사용하여 효과적인 검색을 수행
 context_analyzer 도구를 사용하여 사용자 질문의 성격을 파악하고
 적절한 처리 방법을 결정하세요."""
         
-        if STRANDS_AVAILABLE:
-            try:
-                return Agent(
-                    system_prompt=system_prompt,
-                    tools=[context_analyzer]
-                )
-            except TypeError as e:
-                if "unexpected keyword argument" in str(e):
-                    # Enhanced Mock Agent 사용
-                    return Agent(config=self.config)
-                else:
-                    raise e
-        else:
-            return Agent(config=self.config)
+        return _construct_agent(self.config, system_prompt, [context_analyzer])
     
     def process_query(self, query: str, conversation_history: List[Dict] = None) -> Dict:
         """
@@ -440,7 +547,7 @@ context_analyzer 도구를 사용하여 사용자 질문의 성격을 파악하
         Returns:
             처리 결과
         """
-        start_time = time.time()
+        start_time = time.perf_counter()  # 단조 증가 시계로 처리 시간 측정
         conversation_history = conversation_history or []
         
         print(f"🔍 쿼리 처리 시작: {query}")
@@ -485,13 +592,11 @@ context_analyzer 도구를 사용하여 사용자 질문의 성격을 파악하
             else:
                 # Mock agent 사용
                 print("🔄 Mock Agent 사용")
-                response = self.main_agent(f"""사용자 질문을 처리해주세요:
-
-질문: {query}
-대화 히스토리: {json.dumps(conversation_history[-3:], ensure_ascii=False)}""")
-                
-                processing_time = time.time() - start_time
+                history_str = _dumps(conversation_history[-3:]) if conversation_history else "[]"
+                response = self.main_agent(_MOCK_PROMPT_TMPL.format(query=query, history=history_str))
                 
+                processing_time = time.perf_counter() - start_time
+
                 return {
                     "type": "ProperStrandsReAct",
                     "content": str(response),
@@ -503,24 +608,13 @@ context_analyzer 도구를 사용하여 사용자 질문의 성격을 파악하
                 }
                 
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             error_msg = f"쿼리 처리 중 예외 발생: {str(e)}"
             print(f"❌ {error_msg}")
             
             # 예외 발생 시에도 사용자에게 도움이 되는 응답 제공
-            fallback_response = f"""죄송합니다. 요청을 처리하는 중 문제가 발생했습니다.
+            fallback_response = _EXCEPTION_FALLBACK_TMPL.format(query=query, error=str(e))
 
-**질문:** {query}
-
-**문제:** 시스템 오류가 발생했습니다.
-
-**해결 방법:**
-1. 잠시 후 다시 시도해 주세요
-2. 질문을 더 간단하게 바꿔서 시도해 보세요
-3. 문제가 지속되면 관리자에게 문의하세요
-
-**오류 정보:** {str(e)}"""
-            
             return {
                 "type": "ProperStrandsReAct",
                 "content": fallback_response,
@@ -532,15 +626,6 @@ context_analyzer 도구를 사용하여 사용자 질문의 성격을 파악하
                 "exception_occurred": True,
                 "original_error": str(e)
             }
-            
-        except Exception as e:
-            return {
-                "type": "ProperStrandsReAct",
-                "content": f"처리 중 오류가 발생했습니다: {str(e)}",
-                "processing_time": time.time() - start_time,
-                "error": True,
-                "error_details": str(e)
-            }
     
     def demonstrate_tool_usage(self):
         """실제 Strands 문법의 도구 사용법 시연"""
@@ -588,85 +673,74 @@ context_analyzer 도구를 사용하여 사용자 질문의 성격을 파악하
         }
 
 
+# timeout_resilient_kb_search 기본 동작 파라미터 (페이로드 축소용 제한값 포함)
+_RESILIENT_TIMEOUT_SECONDS = 45
+_RESILIENT_KEYWORD_CAP = 2     # 최대 2개 키워드만 사용 (성능 향상)
+_RESILIENT_CONTENT_CAP = 500   # 결과 내용 길이 제한
+
+
 @tool
 def timeout_resilient_kb_search(keywords: List[str], max_results: int = 3) -> str:
     """
     타임아웃에 강한 Knowledge Base 검색 도구
-    
+
+    키워드와 결과 내용을 제한하여 Bedrock으로 가는 페이로드를 줄이고,
+    공유 스레드 풀 + 타임아웃으로 네트워크 지연에 대비합니다.
+
     Args:
         keywords: 검색할 키워드 리스트
         max_results: 최대 결과 수 (기본값 3으로 축소)
-        
+
     Returns:
         검색 결과를 JSON 문자열로 반환
     """
-    import time
-    import threading
-    from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
-    
-    def search_with_timeout():
+    def search_with_timeout() -> str:
         """실제 검색 수행"""
         # KB 설정 확인
         if not hasattr(kb_search_tool, '_config') or not kb_search_tool._config.is_kb_enabled():
-            return {
-                "success": False,
-                "error": "Knowledge Base가 설정되지 않았습니다.",
-                "results": []
-            }
-        
+            return _ERR_NO_KB
+
         config = kb_search_tool._config
-        
-        from utils.kb_search import KnowledgeBaseSearcher
-        kb_searcher = KnowledgeBaseSearcher()
-        
+        kb_searcher = _get_kb_searcher()
+
         # 키워드 수 제한 (성능 향상)
-        limited_keywords = keywords[:2]  # 최대 2개 키워드만 사용
-        
+        limited_keywords = keywords[:_RESILIENT_KEYWORD_CAP]
+
         search_results = kb_searcher.search_multiple_queries(
             kb_id=config.kb_id,
             queries=limited_keywords,
             max_results_per_query=max(1, max_results // len(limited_keywords))
         )
-        
-        # 결과 정리
+
+        # 결과 정리 (내용 길이 제한)
         formatted_results = []
         for i, result in enumerate(search_results[:max_results]):
             formatted_results.append({
                 "id": i + 1,
-                "content": result.get("content", "")[:500],  # 내용 길이 제한
+                "content": result.get("content", "")[:_RESILIENT_CONTENT_CAP],
                 "source": result.get("source", ""),
                 "score": result.get("score", 0),
                 "query": result.get("query", "")
             })
-        
-        return {
+
+        return _dumps({
             "success": True,
             "results_count": len(formatted_results),
             "results": formatted_results,
             "search_keywords": limited_keywords
-        }
-    
+        })
+
     try:
-        # 60초 타임아웃으로 검색 실행
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(search_with_timeout)
-            result = future.result(timeout=60)  # 60초 타임아웃
-            
-        return json.dumps(result)
-        
+        future = _KB_EXECUTOR.submit(search_with_timeout)
+        return future.result(timeout=_RESILIENT_TIMEOUT_SECONDS)
+
     except FutureTimeoutError:
-        return json.dumps({
-            "success": False,
-            "error": "KB 검색 시간이 초과되었습니다 (60초).",
-            "error_type": "timeout",
-            "results": [],
-            "fallback_suggestion": "네트워크 상태를 확인하거나 더 간단한 키워드로 다시 시도해주세요."
-        })
+        return _ERR_TIMEOUT_45
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"KB 검색 중 오류: {str(e)}",
-            "error_type": "general_error", 
+            "error_type": "general_error",
             "results": [],
             "fallback_suggestion": "일반적인 지식으로 답변하겠습니다."
         })
@@ -3,7 +3,10 @@ AWS Strands Agents 기반 ReAct 챗봇
 기존 수동 ReAct 루프를 Strands Agents 프레임워크로 대체
 """
 
+import asyncio
+import hashlib
 import json
+import re
 import time
 from typing import Dict, List, Any, Optional
 
@@ -18,6 +21,99 @@ except ImportError:
 
 from utils.config import AgentConfig
 from .strands_tools import StrandsToolsManager
+from .timeout_wrapper import timed
+
+# 공유 에이전트 호출 시 역할을 지정하는 프리픽스
+# (시스템 프롬프트는 공통 고정 → 제공자 측 프롬프트 캐시 적중률 향상)
+_ORCHESTRATOR_ROLE = """[역할: 오케스트레이터]
+대화 맥락을 분석하고 적절한 처리 방법을 결정하세요.
+conversation_context_analyzer 도구를 우선 활용하세요."""
+
+_KB_SEARCH_ROLE = """[역할: Knowledge Base 검색 전문가]
+최적의 검색 키워드를 생성하고 검색 결과 품질을 평가하세요.
+
+**품질 기준:**
+- 1-2회차: 엄격한 기준 (평균 점수 0.5 이상)
+- 3-4회차: 완화된 기준 (평균 점수 0.4 이상)
+- 5회차: 매우 완화된 기준 (평균 점수 0.2 이상)"""
+
+_ANSWER_ROLE = """[역할: 답변 생성 전문가]
+검색 결과와 대화 맥락을 바탕으로 정확하고 유용한 답변을 생성하세요.
+
+**Citation 규칙:**
+- 검색 결과 사용 시 [1], [2] 형태로 출처 표시
+- 답변 마지막에 "**참고 자료:**" 섹션 포함
+- 검색 결과에 없는 정보는 추측하지 않음"""
+
+# 규칙 기반 맥락 분석 패턴 (모듈 로드 시 1회 구성)
+_CONTINUATION_PATTERNS = ("다음은", "그럼", "그러면", "또는", "계속")
+_GREETING_PATTERNS = ("안녕", "hello", "hi")
+# 규칙이 분류하지 못한 질문을 LLM으로 승격하는 최소 길이
+_CONTEXT_ESCALATION_MIN_LEN = 30
+
+# LLM 호출 결과 캐시 (대화에서 같은 질문/결과가 재등장할 때 왕복 생략)
+_LLM_RESULT_CACHE: Dict[tuple, tuple] = {}
+_LLM_CACHE_TTL_SECONDS = 1800.0
+_LLM_CACHE_MAX_ENTRIES = 512
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+# 프롬프트 삽입 전 연속 공백 정리용
+_WS_RE = re.compile(r"\s+")
+
+
+def _compact_results(results: List[Dict], max_content: int = 200, max_results: int = 5) -> str:
+    """프롬프트 삽입용으로 검색 결과를 축약 직렬화 (토큰 절감)"""
+    compact = []
+    for i, result in enumerate(results[:max_results]):
+        content = _WS_RE.sub(" ", result.get("content", ""))
+        compact.append({
+            "i": i + 1,
+            "len": len(content),
+            "score": result.get("score"),
+            "snippet": content[:max_content]
+        })
+    return json.dumps(compact, ensure_ascii=False)
+
+
+def _extract_first_json(text: str) -> Optional[Dict]:
+    """응답 문자열에서 첫 번째 JSON 객체를 선형 스캔으로 추출"""
+    start = text.find("{")
+    while start != -1:
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(text, start)
+            if isinstance(parsed, dict):
+                return parsed
+            return None
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
+    return None
+
+
+def _digest(text: str) -> str:
+    """캐시 키용 짧은 해시 생성"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _llm_cache_get(key: tuple) -> Optional[Dict]:
+    """캐시 조회 (TTL 만료 시 제거)"""
+    entry = _LLM_RESULT_CACHE.get(key)
+    if entry is None:
+        return None
+    cached_at, value = entry
+    if time.time() - cached_at > _LLM_CACHE_TTL_SECONDS:
+        _LLM_RESULT_CACHE.pop(key, None)
+        return None
+    return value
+
+
+def _llm_cache_put(key: tuple, value: Dict) -> None:
+    """캐시 저장 (크기 초과 시 가장 오래된 항목부터 제거)"""
+    if len(_LLM_RESULT_CACHE) >= _LLM_CACHE_MAX_ENTRIES:
+        oldest_key = min(_LLM_RESULT_CACHE, key=lambda k: _LLM_RESULT_CACHE[k][0])
+        _LLM_RESULT_CACHE.pop(oldest_key, None)
+    _LLM_RESULT_CACHE[key] = (time.time(), value)
 
 
 class StrandsReActChatbot:
@@ -31,30 +127,24 @@ class StrandsReActChatbot:
     - 대화 맥락 인식
     """
     
-    def __init__(self, config: AgentConfig):
+    def __init__(self, config: AgentConfig, use_llm_orchestration: bool = False):
         self.config = config
         self.tools_manager = StrandsToolsManager(config)
+        # 기계적인 도구 호출을 LLM에 위임할지 여부 (A/B 비교용, 기본은 직접 호출)
+        self.use_llm_orchestration = use_llm_orchestration
+        # 매 턴 재계산하지 않도록 KB 활성화 여부를 1회 캐시
+        self._kb_enabled = config.is_kb_enabled()
         
-        # 메인 오케스트레이터 에이전트 생성
-        self.orchestrator = self._create_orchestrator_agent()
-        
-        # KB 검색 전문 에이전트 생성
-        self.kb_search_agent = self._create_kb_search_agent()
-        
-        # 답변 생성 전문 에이전트 생성
-        self.answer_agent = self._create_answer_agent()
+        # 역할별 에이전트 3개 대신 공유 에이전트 1개 생성
+        # (모델 클라이언트/커넥션 풀을 역할 간 공유, 역할은 호출 시 프리픽스로 지정)
+        self._agent = self._create_shared_agent()
     
-    def _create_orchestrator_agent(self) -> Agent:
-        """메인 오케스트레이터 에이전트 생성"""
+    def _create_shared_agent(self) -> Agent:
+        """역할 공유 에이전트 생성"""
         system_prompt = f"""{self.config.system_prompt or '당신은 도움이 되는 AI 어시스턴트입니다.'}
 
-당신은 사용자 질문을 분석하고 적절한 처리 방법을 결정하는 오케스트레이터입니다.
-
-**주요 역할:**
-1. 대화 맥락 분석 (연속성 질문, 인사말 등)
-2. KB 검색 필요성 판단
-3. 적절한 전문 에이전트에게 작업 위임
-4. 최종 답변 조율
+당신은 사용자 질문을 분석하고 적절한 답변을 제공하는 ReAct 에이전트입니다.
+각 요청의 첫 줄에 [역할: ...] 형태로 수행할 역할이 지정됩니다.
 
 **처리 우선순위:**
 1. 대화 연속성 질문 → 직접 답변
@@ -65,6 +155,7 @@ class StrandsReActChatbot:
 **도구 사용 지침:**
 - conversation_context_analyzer: 먼저 대화 맥락을 분석하세요
 - kb_search_tool: KB 검색이 필요한 경우에만 사용
+- keyword_generator / search_quality_assessor: 검색 키워드 생성과 품질 평가
 - citation_generator: 검색 결과가 있을 때 Citation 추가
 
 항상 한국어로 응답하세요."""
@@ -74,65 +165,9 @@ class StrandsReActChatbot:
             tools=self.tools_manager.get_all_tools()
         )
     
-    def _create_kb_search_agent(self) -> Agent:
-        """KB 검색 전문 에이전트 생성"""
-        system_prompt = """당신은 Knowledge Base 검색 전문가입니다.
-
-**주요 역할:**
-1. 최적의 검색 키워드 생성
-2. KB 검색 실행
-3. 검색 결과 품질 평가
-4. 필요시 재검색 수행
-
-**검색 전략:**
-- 초기 검색: 핵심 키워드 3개로 검색
-- 품질 평가: 관련성 점수와 내용 길이 확인
-- 재검색: 품질이 낮으면 대체 키워드로 재시도 (최대 5회)
-
-**품질 기준:**
-- 1-2회차: 엄격한 기준 (평균 점수 0.5 이상)
-- 3-4회차: 완화된 기준 (평균 점수 0.4 이상)  
-- 5회차: 매우 완화된 기준 (평균 점수 0.2 이상)
-
-항상 한국어로 응답하세요."""
-        
-        return Agent(
-            system_prompt=system_prompt,
-            tools=[
-                self.tools_manager.keyword_generator,
-                self.tools_manager.kb_search_tool,
-                self.tools_manager.search_quality_assessor
-            ]
-        )
-    
-    def _create_answer_agent(self) -> Agent:
-        """답변 생성 전문 에이전트 생성"""
-        system_prompt = f"""{self.config.system_prompt or '당신은 도움이 되는 AI 어시스턴트입니다.'}
-
-당신은 검색 결과를 바탕으로 정확하고 유용한 답변을 생성하는 전문가입니다.
-
-**답변 생성 원칙:**
-1. 검색 결과가 있으면 반드시 활용하고 Citation 포함
-2. 검색 결과가 없으면 일반 지식으로 도움되는 답변 제공
-3. 대화 맥락을 고려한 자연스러운 답변
-4. 구체적이고 실용적인 정보 제공
-
-**Citation 규칙:**
-- 검색 결과 사용 시 [1], [2] 형태로 출처 표시
-- 답변 마지막에 "**참고 자료:**" 섹션 포함
-- 검색 결과에 없는 정보는 추측하지 않음
-
-**대화 연속성:**
-- 이전 대화 내용을 정확히 기억하고 참조
-- "다음은?", "그럼?" 같은 연속성 질문에 적절히 대응
-- 자연스러운 대화 흐름 유지
-
-항상 한국어로 응답하세요."""
-        
-        return Agent(
-            system_prompt=system_prompt,
-            tools=[self.tools_manager.citation_generator]
-        )
+    def _invoke_role(self, role_prompt: str, prompt: str) -> Any:
+        """공유 에이전트를 역할 프리픽스와 함께 호출"""
+        return self._agent(f"{role_prompt}\n\n{prompt}")
     
     async def process_query(self, query: str, conversation_history: List[Dict] = None) -> Dict:
         """
@@ -145,49 +180,86 @@ class StrandsReActChatbot:
         Returns:
             처리 결과
         """
-        start_time = time.time()
-        
-        try:
-            if conversation_history is None:
-                conversation_history = []
-            
-            # 1단계: 대화 맥락 분석
-            context_analysis = await self._analyze_conversation_context(query, conversation_history)
-            
-            # 2단계: 처리 방법 결정 및 실행
-            if context_analysis.get("is_greeting"):
-                result = await self._handle_greeting(query)
-            elif context_analysis.get("is_continuation"):
-                result = await self._handle_continuation(query, conversation_history)
-            elif not self.config.is_kb_enabled():
-                result = await self._handle_direct_answer(query, conversation_history)
-            else:
-                result = await self._handle_kb_search_flow(query, conversation_history, context_analysis)
-            
-            # 처리 시간 계산
-            processing_time = time.time() - start_time
-            
-            return {
-                "type": "StrandsReAct",
-                "content": result.get("answer", "답변을 생성할 수 없습니다."),
-                "processing_time": processing_time,
-                "context_analysis": context_analysis,
-                "search_results": result.get("search_results", []),
-                "citations": result.get("citations", []),
-                "iterations": result.get("iterations", 1),
-                "error": False
-            }
-            
-        except Exception as e:
-            return {
-                "type": "StrandsReAct",
-                "content": f"처리 중 오류가 발생했습니다: {str(e)}",
-                "processing_time": time.time() - start_time,
-                "error": True
-            }
+        with timed() as elapsed:
+            try:
+                if conversation_history is None:
+                    conversation_history = []
+                
+                # 1단계: 규칙 기반 대화 맥락 분석
+                context_analysis = self._fallback_context_analysis(query, conversation_history)
+                
+                # 2단계: 처리 방법 결정 및 실행
+                if self._is_context_ambiguous(query, conversation_history, context_analysis):
+                    # 분류가 애매하면 LLM 분류와 기본 분기를 병렬로 투기 실행,
+                    # 분류 결과가 기본 분기와 일치하면 투기 결과를 그대로 사용
+                    if self._kb_enabled:
+                        speculative_task = asyncio.create_task(
+                            self._handle_kb_search_flow(query, conversation_history, context_analysis)
+                        )
+                    else:
+                        speculative_task = asyncio.create_task(
+                            self._handle_direct_answer(query, conversation_history)
+                        )
+                    
+                    context_analysis = await self._escalate_context_analysis(
+                        query, conversation_history, context_analysis
+                    )
+                    
+                    if context_analysis.get("is_greeting"):
+                        speculative_task.cancel()
+                        result = await self._handle_greeting(query)
+                    elif context_analysis.get("is_continuation"):
+                        speculative_task.cancel()
+                        result = await self._handle_continuation(query, conversation_history)
+                    else:
+                        result = await speculative_task
+                elif context_analysis.get("is_greeting"):
+                    result = await self._handle_greeting(query)
+                elif context_analysis.get("is_continuation"):
+                    result = await self._handle_continuation(query, conversation_history)
+                elif not self._kb_enabled:
+                    result = await self._handle_direct_answer(query, conversation_history)
+                else:
+                    result = await self._handle_kb_search_flow(query, conversation_history, context_analysis)
+                
+                return {
+                    "type": "StrandsReAct",
+                    "content": result.get("answer", "답변을 생성할 수 없습니다."),
+                    "processing_time": elapsed(),
+                    "context_analysis": context_analysis,
+                    "search_results": result.get("search_results", []),
+                    "citations": result.get("citations", []),
+                    "iterations": result.get("iterations", 1),
+                    "error": False
+                }
+                
+            except Exception as e:
+                return {
+                    "type": "StrandsReAct",
+                    "content": f"처리 중 오류가 발생했습니다: {str(e)}",
+                    "processing_time": elapsed(),
+                    "error": True
+                }
+    
+    @staticmethod
+    def _is_context_ambiguous(query: str, history: List[Dict], analysis: Dict) -> bool:
+        """규칙이 명확히 분류하지 못한 긴 질문 + 히스토리가 있는 경우에만 LLM으로 승격"""
+        return (
+            not analysis["is_greeting"]
+            and not analysis["is_continuation"]
+            and bool(history)
+            and len(query) > _CONTEXT_ESCALATION_MIN_LEN
+        )
     
-    async def _analyze_conversation_context(self, query: str, history: List[Dict]) -> Dict:
-        """대화 맥락 분석"""
+    async def _escalate_context_analysis(self, query: str, history: List[Dict], analysis: Dict) -> Dict:
+        """애매한 분류를 LLM으로 재판정 (실패 시 규칙 기반 결과 유지)"""
+        # 동일 질문 + 동일 히스토리 꼬리에 대한 LLM 분석 결과 재사용
+        history_tail = json.dumps(history[-3:], ensure_ascii=False) if history else ""
+        cache_key = ("context", _digest(query), _digest(history_tail))
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Strands Agent를 통한 맥락 분석
             context_prompt = f"""다음 대화 맥락을 분석해주세요:
@@ -197,39 +269,48 @@ class StrandsReActChatbot:
 
 conversation_context_analyzer 도구를 사용하여 분석하고 결과를 JSON 형태로 반환하세요."""
             
-            response = self.orchestrator(context_prompt)
+            response = await asyncio.to_thread(self._invoke_role, _ORCHESTRATOR_ROLE, context_prompt)
             
             # 응답에서 JSON 추출
-            import re
-            json_match = re.search(r'\{.*\}', str(response), re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+            parsed = _extract_first_json(str(response))
+            if parsed is not None:
+                _llm_cache_put(cache_key, parsed)
+                return parsed
             
-            # 폴백 분석
-            return self._fallback_context_analysis(query, history)
+            # 규칙 기반 분석 결과 유지
+            return analysis
             
         except Exception as e:
-            return self._fallback_context_analysis(query, history)
+            return analysis
     
     def _fallback_context_analysis(self, query: str, history: List[Dict]) -> Dict:
-        """폴백 맥락 분석"""
-        continuation_patterns = ["다음은", "그럼", "그러면", "또는", "계속"]
-        greetings = ["안녕", "hello", "hi"]
+        """규칙 기반 맥락 분석 (기본 경로)"""
+        query_lower = query.lower()
         
         return {
-            "is_continuation": any(p in query.lower() for p in continuation_patterns),
-            "is_greeting": any(g in query.lower() for g in greetings) and len(query) < 20,
+            "is_continuation": any(p in query_lower for p in _CONTINUATION_PATTERNS),
+            "is_greeting": any(g in query_lower for g in _GREETING_PATTERNS) and len(query) < 20,
             "has_context": len(history) > 0,
-            "needs_kb_search": self.config.is_kb_enabled()
+            "needs_kb_search": self._kb_enabled
         }
     
+    @staticmethod
+    def _format_history_tail(history: List[Dict], count: int, truncate: Optional[int] = None) -> str:
+        """최근 대화 꼬리를 프롬프트용 텍스트로 구성 (join 기반 1회 조립)"""
+        if not history:
+            return ""
+        return "\n".join(
+            f"{msg.get('role', '')}: {msg.get('content', '')[:truncate] if truncate else msg.get('content', '')}"
+            for msg in history[-count:]
+        ) + "\n"
+    
     async def _handle_greeting(self, query: str) -> Dict:
         """인사말 처리"""
         greeting_prompt = f"""사용자가 인사말을 했습니다: "{query}"
 
 친근하고 도움이 되는 인사말로 응답해주세요. 어떤 도움을 드릴 수 있는지 안내하세요."""
         
-        response = self.answer_agent(greeting_prompt)
+        response = self._invoke_role(_ANSWER_ROLE, greeting_prompt)
         
         return {
             "answer": str(response),
@@ -240,13 +321,12 @@ conversation_context_analyzer 도구를 사용하여 분석하고 결과를 JSON
     
     async def _handle_continuation(self, query: str, history: List[Dict]) -> Dict:
         """대화 연속성 질문 처리"""
+        # 히스토리가 없는 연속성 질문은 의미상 직접 질문과 동일
+        if not history:
+            return await self._handle_direct_answer(query, history)
+        
         # 이전 대화 맥락 구성
-        context_text = ""
-        if history:
-            for msg in history[-4:]:  # 최근 4개 메시지
-                role = msg.get("role", "")
-                content = msg.get("content", "")
-                context_text += f"{role}: {content}\n"
+        context_text = self._format_history_tail(history, 4)  # 최근 4개 메시지
         
         continuation_prompt = f"""이전 대화 맥락:
 {context_text}
@@ -256,7 +336,7 @@ conversation_context_analyzer 도구를 사용하여 분석하고 결과를 JSON
 이전 대화의 내용을 바탕으로 현재 질문에 대한 적절한 답변을 생성해주세요.
 이전 답변에서 언급한 내용을 구체적으로 확장하거나 보완하세요."""
         
-        response = self.answer_agent(continuation_prompt)
+        response = self._invoke_role(_ANSWER_ROLE, continuation_prompt)
         
         return {
             "answer": str(response),
@@ -267,23 +347,16 @@ conversation_context_analyzer 도구를 사용하여 분석하고 결과를 JSON
     
     async def _handle_direct_answer(self, query: str, history: List[Dict]) -> Dict:
         """직접 답변 처리 (KB 없음)"""
-        # 대화 맥락 포함
-        context_text = ""
-        if history:
-            for msg in history[-3:]:
-                role = msg.get("role", "")
-                content = msg.get("content", "")[:200]
-                context_text += f"{role}: {content}\n"
+        # 대화 맥락 포함 (히스토리가 없으면 빈 맥락 블록을 프롬프트에서 생략)
+        context_text = self._format_history_tail(history, 3, truncate=200)
+        context_block = f"이전 대화 맥락:\n{context_text}\n" if context_text else ""
         
-        direct_prompt = f"""이전 대화 맥락:
-{context_text}
-
-현재 질문: {query}
+        direct_prompt = f"""{context_block}현재 질문: {query}
 
 Knowledge Base가 없으므로 일반적인 지식을 바탕으로 도움이 되는 답변을 제공해주세요.
 이전 대화와 관련이 있다면 그 연관성을 언급하면서 답변해주세요."""
         
-        response = self.answer_agent(direct_prompt)
+        response = self._invoke_role(_ANSWER_ROLE, direct_prompt)
         
         return {
             "answer": str(response),
@@ -295,15 +368,19 @@ Knowledge Base가 없으므로 일반적인 지식을 바탕으로 도움이 되
     async def _handle_kb_search_flow(self, query: str, history: List[Dict], context_analysis: Dict) -> Dict:
         """KB 검색 플로우 처리"""
         max_iterations = 5
-        current_iteration = 1
         search_results = []
         previous_keywords = []
+        retry_keywords_task = None
         
-        while current_iteration <= max_iterations:
+        # 상한이 고정된 루프이므로 while + 수동 증가 대신 bounded for 사용
+        for current_iteration in range(1, max_iterations + 1):
             print(f"🔄 KB 검색 반복 {current_iteration}회차")
             
-            # 키워드 생성
-            if current_iteration == 1:
+            # 키워드 생성 (이전 회차에서 투기적으로 시작한 작업이 있으면 그 결과 사용)
+            if retry_keywords_task is not None:
+                keywords_result = await retry_keywords_task
+                retry_keywords_task = None
+            elif current_iteration == 1:
                 keywords_result = await self._generate_initial_keywords(query)
             else:
                 keywords_result = await self._generate_retry_keywords(query, previous_keywords)
@@ -315,35 +392,36 @@ Knowledge Base가 없으므로 일반적인 지식을 바탕으로 도움이 되
             print(f"   🔍 검색 키워드: {keywords}")
             previous_keywords.extend(keywords)
             
-            # KB 검색 실행
-            search_prompt = f"""다음 키워드로 Knowledge Base 검색을 수행하세요:
-키워드: {keywords}
-최대 결과: 5개
-
-kb_search_tool을 사용하여 검색하고 결과를 분석하세요."""
-            
-            search_response = self.kb_search_agent(search_prompt)
+            # KB 검색 실행 (기계적인 검색 단계는 LLM 위임 없이 도구를 직접 호출)
+            # 키워드 병렬 분배와 중복 제거는 search_multiple_queries가 내부에서 수행
+            search_response = await asyncio.to_thread(
+                self.tools_manager.kb_search_tool, keywords, 5
+            )
             
             # 검색 결과 추출
             try:
-                import re
-                json_match = re.search(r'\{.*\}', str(search_response), re.DOTALL)
-                if json_match:
-                    search_data = json.loads(json_match.group())
-                    if search_data.get("success"):
-                        search_results = search_data.get("results", [])
+                search_data = json.loads(search_response)
+                if search_data.get("success"):
+                    search_results = search_data.get("results", [])
             except:
                 pass
             
-            # 품질 평가
+            # 품질 평가와 다음 회차용 재시도 키워드 생성을 병렬로 수행
+            # (평가가 충분하다고 판단되면 재시도 키워드 작업은 취소)
+            if current_iteration < max_iterations:
+                retry_keywords_task = asyncio.create_task(
+                    self._generate_retry_keywords(query, previous_keywords)
+                )
+            
             quality_result = await self._assess_search_quality(search_results, current_iteration)
             
             if quality_result.get("is_sufficient") or current_iteration >= max_iterations:
                 print(f"   ✅ 검색 완료: {quality_result.get('reason')}")
+                if retry_keywords_task is not None:
+                    retry_keywords_task.cancel()
                 break
-            else:
-                print(f"   🔄 재시도 필요: {quality_result.get('reason')}")
-                current_iteration += 1
+            
+            print(f"   🔄 재시도 필요: {quality_result.get('reason')}")
         
         # 최종 답변 생성
         answer = await self._generate_final_answer(query, history, search_results, current_iteration)
@@ -358,19 +436,30 @@ kb_search_tool을 사용하여 검색하고 결과를 분석하세요."""
     async def _generate_initial_keywords(self, query: str) -> Dict:
         """초기 키워드 생성"""
         try:
-            keywords_prompt = f"""다음 질문에 대한 최적의 검색 키워드를 생성하세요:
-질문: {query}
-KB 설명: {self.config.kb_description}
-
-keyword_generator 도구를 사용하여 키워드를 생성하세요."""
+            # 동일 질문 + 동일 KB 설명에 대한 키워드 재사용
+            cache_key = ("keywords", _digest(query), _digest(self.config.kb_description or ""))
+            cached = _llm_cache_get(cache_key)
+            if cached is not None:
+                return cached
             
-            response = self.kb_search_agent(keywords_prompt)
+            if self.use_llm_orchestration:
+                keywords_prompt = f"""keyword_generator 도구를 사용하여 다음 질문에 대한 최적의 검색 키워드를 생성하세요.
+
+질문: {query}
+KB 설명: {self.config.kb_description}"""
+                
+                response = await asyncio.to_thread(self._invoke_role, _KB_SEARCH_ROLE, keywords_prompt)
+                parsed = _extract_first_json(str(response))
+            else:
+                # 기계적인 도구 호출은 LLM 위임 없이 직접 수행
+                response = await asyncio.to_thread(
+                    self.tools_manager.keyword_generator, query, self.config.kb_description or ""
+                )
+                parsed = json.loads(response)
             
-            # JSON 추출
-            import re
-            json_match = re.search(r'\{.*\}', str(response), re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+            if parsed is not None:
+                _llm_cache_put(cache_key, parsed)
+                return parsed
             
             return {"keywords": [query[:20]]}
             
@@ -380,19 +469,27 @@ keyword_generator 도구를 사용하여 키워드를 생성하세요."""
     async def _generate_retry_keywords(self, query: str, previous_keywords: List[str]) -> Dict:
         """재시도 키워드 생성"""
         try:
-            retry_prompt = f"""이전 검색 키워드로 충분한 결과를 얻지 못했습니다.
+            if self.use_llm_orchestration:
+                retry_prompt = f"""이전 검색 키워드로 충분한 결과를 얻지 못했습니다.
 질문: {query}
 이전 키워드: {previous_keywords}
 
 keyword_generator 도구를 사용하여 대체 키워드를 생성하세요."""
-            
-            response = self.kb_search_agent(retry_prompt)
-            
-            # JSON 추출
-            import re
-            json_match = re.search(r'\{.*\}', str(response), re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+                
+                response = await asyncio.to_thread(self._invoke_role, _KB_SEARCH_ROLE, retry_prompt)
+                parsed = _extract_first_json(str(response))
+            else:
+                # 대체 키워드 생성기를 직접 호출
+                response = await asyncio.to_thread(
+                    self.tools_manager.keyword_generator,
+                    query,
+                    self.config.kb_description or "",
+                    previous_keywords
+                )
+                parsed = json.loads(response)
+            
+            if parsed is not None:
+                return parsed
             
             return {"keywords": []}
             
@@ -402,19 +499,31 @@ keyword_generator 도구를 사용하여 대체 키워드를 생성하세요."""
     async def _assess_search_quality(self, search_results: List[Dict], iteration: int) -> Dict:
         """검색 품질 평가"""
         try:
+            if not self.use_llm_orchestration:
+                # 평가 로직은 순수 파이썬 계산이므로 직접 호출 (LLM 왕복/캐시 불필요)
+                return json.loads(
+                    self.tools_manager.search_quality_assessor(search_results, iteration)
+                )
+            
+            # 동일 결과 집합 + 동일 회차에 대한 평가 재사용 (LLM 위임 경로)
+            results_signature = "|".join(result.get("content", "")[:100] for result in search_results)
+            cache_key = ("quality", _digest(results_signature), iteration)
+            cached = _llm_cache_get(cache_key)
+            if cached is not None:
+                return cached
             quality_prompt = f"""다음 검색 결과의 품질을 평가하세요:
-검색 결과: {json.dumps(search_results, ensure_ascii=False)}
+검색 결과: {_compact_results(search_results)}
 현재 반복: {iteration}회차
 
 search_quality_assessor 도구를 사용하여 품질을 평가하세요."""
             
-            response = self.kb_search_agent(quality_prompt)
+            response = await asyncio.to_thread(self._invoke_role, _KB_SEARCH_ROLE, quality_prompt)
             
             # JSON 추출
-            import re
-            json_match = re.search(r'\{.*\}', str(response), re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+            parsed = _extract_first_json(str(response))
+            if parsed is not None:
+                _llm_cache_put(cache_key, parsed)
+                return parsed
             
             return {"is_sufficient": iteration >= 5, "reason": "평가 실패"}
             
@@ -424,26 +533,19 @@ search_quality_assessor 도구를 사용하여 품질을 평가하세요."""
     async def _generate_final_answer(self, query: str, history: List[Dict], search_results: List[Dict], iterations: int) -> str:
         """최종 답변 생성"""
         try:
-            # 대화 맥락 구성
-            context_text = ""
-            if history:
-                for msg in history[-3:]:
-                    role = msg.get("role", "")
-                    content = msg.get("content", "")[:200]
-                    context_text += f"{role}: {content}\n"
+            # 대화 맥락 구성 (히스토리가 없으면 빈 맥락 블록을 프롬프트에서 생략)
+            context_text = self._format_history_tail(history, 3, truncate=200)
+            context_block = f"이전 대화 맥락:\n{context_text}\n" if context_text else ""
             
-            # 검색 결과 텍스트 구성
+            # 검색 결과 텍스트 구성 (연속 공백 정리 후 필드별 절단)
             results_text = ""
             if search_results:
                 for i, result in enumerate(search_results):
-                    content = result.get("content", "")[:400]
+                    content = _WS_RE.sub(" ", result.get("content", ""))[:400]
                     source = result.get("source", "")
                     results_text += f"[{i+1}] {content}...\n출처: {source}\n\n"
             
-            answer_prompt = f"""이전 대화 맥락:
-{context_text}
-
-현재 질문: {query}
+            answer_prompt = f"""{context_block}현재 질문: {query}
 
 Knowledge Base 검색 결과 ({iterations}회 검색):
 {results_text}
@@ -458,7 +560,7 @@ Knowledge Base 검색 결과 ({iterations}회 검색):
 
 citation_generator 도구를 사용하여 Citation을 포함한 답변을 생성하세요."""
             
-            response = self.answer_agent(answer_prompt)
+            response = await asyncio.to_thread(self._invoke_role, _ANSWER_ROLE, answer_prompt)
             return str(response)
             
         except Exception as e:
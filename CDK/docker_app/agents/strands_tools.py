@@ -4,7 +4,12 @@ Knowledge Base 검색 및 분석을 위한 도구들
 """
 
 from typing import Dict, List, Any, Optional
+import hashlib
 import json
+import os
+import shelve
+import threading
+import time
 
 # Strands import with fallback to mock
 try:
@@ -19,6 +24,47 @@ from utils.config import AgentConfig
 from utils.kb_search import KnowledgeBaseSearcher
 from utils.bedrock_client import BedrockClient
 
+# 프로세스 재시작 후에도 재사용되는 디스크 캐시 (키워드 생성/KB 검색 결과)
+_DISK_CACHE_DIR = os.path.expanduser("~/.cache/strands_agent")
+_DISK_CACHE_PATH = os.path.join(_DISK_CACHE_DIR, "results")
+_DISK_CACHE_TTL_SECONDS = 24 * 3600.0
+_DISK_CACHE_MAX_ENTRIES = 1024
+_DISK_CACHE_LOCK = threading.Lock()
+
+
+def _disk_cache_key(*parts: str) -> str:
+    """캐시 키용 해시 생성"""
+    return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _disk_cache_get(key: str) -> Optional[str]:
+    """디스크 캐시 조회 (TTL 만료/IO 오류 시 None)"""
+    try:
+        with _DISK_CACHE_LOCK, shelve.open(_DISK_CACHE_PATH) as cache:
+            entry = cache.get(key)
+    except Exception:
+        return None
+    if entry is None or time.time() - entry["cached_at"] > _DISK_CACHE_TTL_SECONDS:
+        return None
+    return entry["value"]
+
+
+def _disk_cache_put(key: str, value: str) -> None:
+    """디스크 캐시 저장 (크기 초과 시 만료 항목부터 정리, IO 오류는 무시)"""
+    try:
+        os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+        now = time.time()
+        with _DISK_CACHE_LOCK, shelve.open(_DISK_CACHE_PATH) as cache:
+            if len(cache) >= _DISK_CACHE_MAX_ENTRIES:
+                for stale_key in [
+                    k for k, v in cache.items()
+                    if now - v["cached_at"] > _DISK_CACHE_TTL_SECONDS
+                ]:
+                    del cache[stale_key]
+            cache[key] = {"cached_at": now, "value": value}
+    except Exception:
+        pass
+
 
 class StrandsToolsManager:
     """Strands Agents 도구 관리자"""
@@ -138,6 +184,14 @@ class StrandsToolsManager:
                     "results": []
                 })
             
+            # 재시작 이후에도 동일 검색을 재사용 (성공 결과만 저장)
+            cache_key = _disk_cache_key(
+                "kb_search", self.config.kb_id or "", "|".join(sorted(keywords)), str(max_results)
+            )
+            cached = _disk_cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
             # 다중 키워드 검색
             search_results = self.kb_searcher.search_multiple_queries(
                 kb_id=self.config.kb_id,
@@ -156,12 +210,14 @@ class StrandsToolsManager:
                     "query": result.get("query", "")
                 })
             
-            return json.dumps({
+            payload = json.dumps({
                 "success": True,
                 "results_count": len(formatted_results),
                 "results": formatted_results,
                 "search_keywords": keywords
             })
+            _disk_cache_put(cache_key, payload)
+            return payload
             
         except Exception as e:
             return json.dumps({
@@ -223,8 +279,7 @@ class StrandsToolsManager:
                 "needs_kb_search": True
             })
     
-    @tool
-    def search_quality_assessor(self, search_results: List[Dict], iteration: int = 1) -> str:
+    def _quality_assessment_impl(self, search_results: List[Dict], iteration: int = 1) -> str:
         """
         검색 결과의 품질을 평가하고 재시도 필요성을 판단합니다.
         
@@ -291,8 +346,7 @@ class StrandsToolsManager:
                 "is_sufficient": True  # 오류 시 진행
             })
     
-    @tool
-    def citation_generator(self, search_results: List[Dict], answer: str) -> str:
+    def _citation_generation_impl(self, search_results: List[Dict], answer: str) -> str:
         """
         검색 결과를 바탕으로 Citation이 포함된 답변을 생성합니다.
         
@@ -325,8 +379,7 @@ class StrandsToolsManager:
         except Exception as e:
             return f"{answer}\n\n(Citation 생성 중 오류 발생: {str(e)})"
     
-    @tool
-    def keyword_generator(self, query: str, kb_description: str = "", previous_keywords: List[str] = None) -> str:
+    def _keyword_generation_impl(self, query: str, kb_description: str = "", previous_keywords: List[str] = None) -> str:
         """
         검색을 위한 최적화된 키워드를 생성합니다.
         
@@ -339,10 +392,16 @@ class StrandsToolsManager:
             생성된 키워드를 JSON 문자열로 반환
         """
         try:
-            # 재시도인 경우 대체 키워드 생성
+            # 재시도인 경우 대체 키워드 생성 (순수 파이썬이므로 캐시 불필요)
             if previous_keywords:
                 return json.dumps(self._generate_alternative_keywords(query, previous_keywords))
             
+            # 재시작 이후에도 동일 질문의 키워드를 재사용
+            cache_key = _disk_cache_key("keywords", query, self.config.kb_id or "", kb_description)
+            cached = _disk_cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
             # 초기 키워드 생성
             prompt = f"""사용자 질문: {query}
 KB 설명: {kb_description}
@@ -365,7 +424,9 @@ JSON 배열 형태로만 응답하세요: ["키워드1", "키워드2", "키워
                 keywords_json = json_match.group()
                 keywords = json.loads(keywords_json)
                 if isinstance(keywords, list) and len(keywords) > 0:
-                    return json.dumps({"keywords": keywords[:3]})
+                    payload = json.dumps({"keywords": keywords[:3]})
+                    _disk_cache_put(cache_key, payload)
+                    return payload
             
             # 폴백
             return json.dumps({"keywords": self._extract_keywords_fallback(query)})
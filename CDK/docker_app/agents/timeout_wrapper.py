@@ -3,8 +3,11 @@ Strands Agents 호출을 위한 타임아웃 래퍼
 네트워크 타임아웃 발생 시 graceful fallback 제공
 """
 
+import asyncio
+import atexit
+import os
+import re
 import time
-import signal
 from contextlib import contextmanager
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Any, Dict, Optional
@@ -15,26 +18,79 @@ class TimeoutException(Exception):
     pass
 
 
+# 폴백 응답 분류용 패턴 (모듈 로드 시 1회 컴파일)
+# 한국어 질문은 공백 단위 토큰화가 안 되므로 부분 문자열 매칭을 유지
+_GREETING_RE = re.compile(r"안녕|hello|hi|반갑")
+_INVESTMENT_RE = re.compile(r"투자|investment|승인|approval")
+_POLICY_RE = re.compile(r"정책|policy|절차|procedure")
+
+
 @contextmanager
-def timeout_handler(seconds: int):
-    """시그널 기반 타임아웃 핸들러"""
-    def timeout_signal_handler(signum, frame):
-        raise TimeoutException(f"Operation timed out after {seconds} seconds")
-    
-    # 기존 핸들러 저장
-    old_handler = signal.signal(signal.SIGALRM, timeout_signal_handler)
-    signal.alarm(seconds)
-    
+def timed():
+    """단조 시계 기반 경과 시간 측정 (벽시계 보정에 영향받지 않음)
+
+    사용 예:
+        with timed() as elapsed:
+            ...
+            result["processing_time"] = elapsed()
+    """
+    start_ns = time.perf_counter_ns()
+    yield lambda: (time.perf_counter_ns() - start_ns) / 1e9
+
+
+# 에이전트 호출용 공유 스레드 풀 (호출마다 풀을 새로 만들지 않도록 모듈 레벨에서 1회 생성)
+# 동시 사용자 수에 맞춰 CHATBOT_AGENT_POOL_WORKERS 환경 변수로 워커 수 조정 가능
+_AGENT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("CHATBOT_AGENT_POOL_WORKERS", "8")),
+    thread_name_prefix="agent-call"
+)
+atexit.register(_AGENT_EXECUTOR.shutdown)
+
+
+def _invoke_agent(agent, query: str, conversation_history: list) -> Dict[str, Any]:
+    """실제 에이전트 호출 (동기/비동기 래퍼가 공유)"""
     try:
-        yield
-    finally:
-        signal.alarm(0)
-        signal.signal(signal.SIGALRM, old_handler)
+        # Strands Agent 호출 방식 수정
+        prompt = f"""사용자 질문을 처리해주세요:
 
+질문: {query}
+대화 히스토리: {conversation_history[-3:] if conversation_history else []}
 
-def safe_agent_call(agent, query: str, conversation_history: list, timeout_seconds: int = 60) -> Dict[str, Any]:
+다음 단계를 따라 처리하세요:
+1. context_analyzer로 맥락 분석
+2. 필요시 timeout_resilient_kb_search로 검색
+3. 검색 결과가 있으면 quality_assessor로 평가
+4. 최종 답변 생성
+
+**중요:** 타임아웃이 발생할 수 있으므로 간결하게 처리하세요."""
+
+        # Strands Agent는 callable 객체로 호출
+        response = agent(prompt)
+        
+        return {
+            "success": True,
+            "content": str(response),
+            "error": None,
+            "timeout": False
+        }
+    except Exception as e:
+        error_str = str(e)
+        is_timeout = any(keyword in error_str.lower() for keyword in [
+            "timeout", "timed out", "read timed out", "connection timeout",
+            "readtimeouterror", "connecttimeouterror"
+        ])
+        
+        return {
+            "success": False,
+            "content": None,
+            "error": error_str,
+            "timeout": is_timeout
+        }
+
+
+async def safe_agent_call_async(agent, query: str, conversation_history: list, timeout_seconds: int = 60) -> Dict[str, Any]:
     """
-    안전한 에이전트 호출 (타임아웃 처리 포함)
+    안전한 에이전트 호출 (비동기 버전, asyncio.wait_for 기반 타임아웃)
     
     Args:
         agent: Strands Agent 인스턴스
@@ -45,85 +101,82 @@ def safe_agent_call(agent, query: str, conversation_history: list, timeout_secon
     Returns:
         Dict containing response or error information
     """
+    loop = asyncio.get_running_loop()
     
-    def _agent_call():
-        """실제 에이전트 호출"""
+    with timed() as elapsed:
         try:
-            # Strands Agent 호출 방식 수정
-            prompt = f"""사용자 질문을 처리해주세요:
-
-질문: {query}
-대화 히스토리: {conversation_history[-3:] if conversation_history else []}
-
-다음 단계를 따라 처리하세요:
-1. context_analyzer로 맥락 분석
-2. 필요시 timeout_resilient_kb_search로 검색
-3. 검색 결과가 있으면 quality_assessor로 평가
-4. 최종 답변 생성
-
-**중요:** 타임아웃이 발생할 수 있으므로 간결하게 처리하세요."""
-
-            # Strands Agent는 callable 객체로 호출
-            response = agent(prompt)
-            
+            result = await asyncio.wait_for(
+                loop.run_in_executor(_AGENT_EXECUTOR, _invoke_agent, agent, query, conversation_history),
+                timeout=timeout_seconds
+            )
+            result["processing_time"] = elapsed()
+            return result
+        
+        except asyncio.TimeoutError:
             return {
-                "success": True,
-                "content": str(response),
-                "error": None,
-                "timeout": False
+                "success": False,
+                "content": generate_timeout_fallback_response(query),
+                "error": f"Request timed out after {timeout_seconds} seconds",
+                "timeout": True,
+                "processing_time": elapsed(),
+                "fallback": True
             }
+        
         except Exception as e:
-            error_str = str(e)
-            is_timeout = any(keyword in error_str.lower() for keyword in [
-                "timeout", "timed out", "read timed out", "connection timeout",
-                "readtimeouterror", "connecttimeouterror"
-            ])
-            
             return {
                 "success": False,
-                "content": None,
-                "error": error_str,
-                "timeout": is_timeout
+                "content": generate_error_fallback_response(query, str(e)),
+                "error": str(e),
+                "timeout": False,
+                "processing_time": elapsed(),
+                "fallback": True
             }
+
+
+def safe_agent_call(agent, query: str, conversation_history: list, timeout_seconds: int = 60) -> Dict[str, Any]:
+    """
+    안전한 에이전트 호출 (타임아웃 처리 포함)
     
-    start_time = time.time()
+    Args:
+        agent: Strands Agent 인스턴스
+        query: 사용자 쿼리
+        conversation_history: 대화 히스토리
+        timeout_seconds: 타임아웃 시간 (초)
     
-    try:
-        # ThreadPoolExecutor를 사용한 타임아웃 처리
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(_agent_call)
-            
+    Returns:
+        Dict containing response or error information
+    """
+    with timed() as elapsed:
+        try:
+            # 공유 스레드 풀을 사용한 타임아웃 처리
+            future = _AGENT_EXECUTOR.submit(_invoke_agent, agent, query, conversation_history)
+
             try:
                 result = future.result(timeout=timeout_seconds)
-                processing_time = time.time() - start_time
-                result["processing_time"] = processing_time
-                
+                result["processing_time"] = elapsed()
+
                 return result
-                
+
             except FutureTimeoutError:
                 # 타임아웃 발생 시 fallback 응답
-                processing_time = time.time() - start_time
-                
                 return {
                     "success": False,
                     "content": generate_timeout_fallback_response(query),
                     "error": f"Request timed out after {timeout_seconds} seconds",
                     "timeout": True,
-                    "processing_time": processing_time,
+                    "processing_time": elapsed(),
                     "fallback": True
                 }
-                
-    except Exception as e:
-        processing_time = time.time() - start_time
-        
-        return {
-            "success": False,
-            "content": generate_error_fallback_response(query, str(e)),
-            "error": str(e),
-            "timeout": False,
-            "processing_time": processing_time,
-            "fallback": True
-        }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "content": generate_error_fallback_response(query, str(e)),
+                "error": str(e),
+                "timeout": False,
+                "processing_time": elapsed(),
+                "fallback": True
+            }
 
 
 def generate_timeout_fallback_response(query: str) -> str:
@@ -132,13 +185,13 @@ def generate_timeout_fallback_response(query: str) -> str:
     # 간단한 키워드 기반 응답
     query_lower = query.lower()
     
-    if any(word in query_lower for word in ["안녕", "hello", "hi", "반갑"]):
+    if _GREETING_RE.search(query_lower):
         return """안녕하세요! 반갑습니다. 
 
 ⚠️ 현재 네트워크 연결이 불안정하여 Knowledge Base 검색을 수행할 수 없습니다. 
 일반적인 질문에 대해서는 답변해 드릴 수 있으니, 다시 질문해 주세요."""
 
-    elif any(word in query_lower for word in ["투자", "investment", "승인", "approval"]):
+    elif _INVESTMENT_RE.search(query_lower):
         return """투자 승인 절차에 대한 질문을 주셨군요.
 
 ⚠️ 현재 Knowledge Base 연결에 문제가 있어 정확한 회사 정책을 확인할 수 없습니다.
@@ -152,7 +205,7 @@ def generate_timeout_fallback_response(query: str) -> str:
 
 정확한 회사 정책은 네트워크 상태가 개선된 후 다시 문의해 주세요."""
 
-    elif any(word in query_lower for word in ["정책", "policy", "절차", "procedure"]):
+    elif _POLICY_RE.search(query_lower):
         return """회사 정책이나 절차에 대한 질문을 주셨군요.
 
 ⚠️ 현재 Knowledge Base에 연결할 수 없어 정확한 회사 정책을 확인할 수 없습니다.
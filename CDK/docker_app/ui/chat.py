@@ -4,10 +4,124 @@ ReAct Agent 응답 구조와 호환성 개선
 """
 
 import streamlit as st
+from functools import lru_cache
 from typing import List, Dict, Any
 import time
+import traceback
+import uuid
 
 from utils.config import AgentConfig
+from agents.react_agent import ReActAgent
+from agents.strands_adapter_simple import SimpleStrandsCompatibilityAdapter
+
+# Strands 구현은 선택적 의존 — 없으면 간소화 어댑터로 폴백
+try:
+    from agents.enhanced_mock_strands import EnhancedMockStrandsAgent
+except ImportError:
+    EnhancedMockStrandsAgent = None
+
+# 대화 히스토리에 허용하는 대략적 토큰 예산
+_HISTORY_TOKEN_BUDGET = 6000
+
+# 기본으로 렌더링하는 최근 메시지 수 (이전 메시지는 버튼으로 추가 로드)
+_CHAT_PAGE_SIZE = 20
+
+# 진행률 표시 기준 최대 ReAct 반복 횟수
+_MAX_ITERATIONS = 5
+
+
+def _fragment_if_available(func):
+    """st.fragment 지원 시 부분 재렌더링 적용 (구버전 Streamlit은 그대로 실행)"""
+    fragment = getattr(st, "fragment", None)
+    return fragment(func) if fragment else func
+
+
+# 단계 타입 -> (아이콘, 색상) 매핑 (모듈 로드 시 1회 구성)
+_STEP_STYLE = {
+    "Orchestration": ("🎯", "blue"),
+    "Action": ("⚡", "green"),
+    "Observation": ("👁️", "orange"),
+    "Error": ("❌", "red"),
+}
+_DEFAULT_STEP_STYLE = ("ℹ️", "gray")
+
+# 모델 ID 부분 문자열 -> 짧은 표시 이름 (순서대로 첫 매칭 사용)
+_MODEL_PREFIXES = (
+    ("claude-sonnet-4", "Claude 4"),
+    ("claude-3-7-sonnet", "Claude 3.7"),
+    ("claude-3-5-sonnet", "Claude 3.5 Sonnet"),
+    ("claude-3-5-haiku", "Claude 3.5 Haiku"),
+    ("nova-lite", "Nova Lite"),
+    ("nova-micro", "Nova Micro"),
+)
+
+
+@st.cache_resource
+def _get_react_agent(orchestration_model: str,
+                     action_model: str,
+                     observation_model: str,
+                     system_prompt: str,
+                     temperature: float,
+                     max_tokens: int,
+                     kb_id: str,
+                     kb_description: str,
+                     max_iterations: int,
+                     max_errors: int):
+    """설정별 Legacy ReAct Agent 재사용 (Streamlit rerun마다 재생성 방지)
+
+    Streamlit은 입력마다 스크립트 전체를 재실행하므로, Agent(및 내부 boto3
+    클라이언트) 생성을 cache_resource로 캐시하여 동일 설정이면 재사용한다.
+    캐시 키는 해시 가능한 기본 타입 필드만 사용.
+    """
+    config = AgentConfig(
+        orchestration_model=orchestration_model,
+        action_model=action_model,
+        observation_model=observation_model,
+        system_prompt=system_prompt,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        kb_id=kb_id,
+        kb_description=kb_description,
+        max_iterations=max_iterations,
+        max_errors=max_errors,
+    )
+    return ReActAgent(config)
+
+
+@st.cache_resource
+def _get_strands_chatbot(orchestration_model: str,
+                         action_model: str,
+                         observation_model: str,
+                         system_prompt: str,
+                         temperature: float,
+                         max_tokens: int,
+                         kb_id: str,
+                         kb_description: str,
+                         max_iterations: int,
+                         max_errors: int):
+    """설정별 Strands 챗봇 재사용 (rerun마다 어댑터/이벤트 루프 재생성 방지)
+
+    (챗봇 인스턴스, 표시용 시스템 이름) 튜플을 반환한다.
+    """
+    config = AgentConfig(
+        orchestration_model=orchestration_model,
+        action_model=action_model,
+        observation_model=observation_model,
+        system_prompt=system_prompt,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        kb_id=kb_id,
+        kb_description=kb_description,
+        max_iterations=max_iterations,
+        max_errors=max_errors,
+    )
+    if EnhancedMockStrandsAgent is not None:
+        print("✅ Strands Agents 사용 (실제 KB 검색 지원)")
+        return EnhancedMockStrandsAgent(config), "Strands Agents"
+    
+    # 폴백: 간소화된 구현 사용
+    print("⚠️ Simple Strands Agents 사용")
+    return SimpleStrandsCompatibilityAdapter(config, use_strands=True), "Simple Strands Agents"
 
 
 def render_chat_interface(config: AgentConfig) -> None:
@@ -17,9 +131,8 @@ def render_chat_interface(config: AgentConfig) -> None:
     Args:
         config: Agent 설정
     """
-    # 채팅 메시지 초기화
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
+    # 세션 상태 초기화
+    _init_session_state()
     
     # 채팅 기록 표시
     _render_chat_history()
@@ -28,9 +141,41 @@ def render_chat_interface(config: AgentConfig) -> None:
     _handle_user_input(config)
 
 
+def _commit_message(message: Dict[str, Any]) -> None:
+    """메시지를 세션 상태에 1회 커밋 (표시용 목록과 포맷 히스토리 동시 갱신)"""
+    st.session_state.messages.append(message)
+    st.session_state.formatted_history.append({
+        "role": message["role"],
+        "content": str(message["content"]),
+        "timestamp": message["timestamp"]
+    })
+
+
+def _init_session_state():
+    """채팅 관련 세션 상태 초기화 (setdefault로 멤버십 검사+조건 대입 단일화)"""
+    st.session_state.setdefault("messages", [])
+    # Agent에 전달할 포맷 히스토리 (턴마다 재구성하지 않고 증분 누적)
+    st.session_state.setdefault("formatted_history", [])
+    st.session_state.setdefault("visible_message_count", _CHAT_PAGE_SIZE)
+
+
+@_fragment_if_available
 def _render_chat_history():
-    """채팅 기록 표시"""
-    for message in st.session_state.messages:
+    """채팅 기록 표시 (fragment 범위로 분리되어 무관한 상호작용 시 재렌더링 생략)"""
+    messages = st.session_state.messages
+    visible = st.session_state.visible_message_count
+    
+    # 긴 대화는 최근 메시지만 렌더링하고 이전 기록은 요청 시 추가 로드
+    if len(messages) > visible:
+        remaining = len(messages) - visible
+        if st.button(f"⬆️ 이전 메시지 {remaining}개 더 보기", key="load_earlier_messages"):
+            st.session_state.visible_message_count = visible + _CHAT_PAGE_SIZE
+            visible = st.session_state.visible_message_count
+    
+    if len(messages) > visible:
+        messages = messages[-visible:]
+    
+    for message in messages:
         with st.chat_message(message["role"]):
             if message["role"] == "assistant":
                 # Assistant 메시지의 경우 ReAct 단계 정보도 표시
@@ -44,8 +189,12 @@ def _render_chat_history():
                     st.write("(메시지 내용 없음)")
 
 
+@_fragment_if_available
 def _render_assistant_message(message: Dict[str, Any]):
-    """Assistant 메시지 렌더링 (ReAct 단계 포함)"""
+    """Assistant 메시지 렌더링 (ReAct 단계 포함)
+
+    fragment 범위로 분리되어 내부 expander 조작 시 해당 메시지만 재렌더링된다.
+    """
     # 최종 답변 표시 (안전한 방식)
     content = message.get("content", message.get("final_answer", "응답을 생성할 수 없습니다."))
     st.write(content)
@@ -65,163 +214,167 @@ def _render_react_steps(react_steps: List[Dict]):
         return
         
     with st.expander("🔍 ReAct 단계별 상세 정보", expanded=False):
+        # 연속된 정적 단계는 구분선 포함 마크다운 하나로 모아서 방출
+        # (st.divider 위젯 N-1개 대신 단일 위젯)
+        pending = []
+        
+        def _flush():
+            if pending:
+                st.markdown("\n\n---\n\n".join(pending))
+                pending.clear()
+        
         for i, step in enumerate(react_steps):
             step_type = step.get("type", "Unknown")
             step_content = step.get("content", "")
             
-            # 단계별 아이콘 설정
-            if step_type == "Orchestration":
-                icon = "🎯"
-                color = "blue"
-            elif step_type == "Action":
-                icon = "⚡"
-                color = "green"
-            elif step_type == "Observation":
-                icon = "👁️"
-                color = "orange"
-            elif step_type == "Error":
-                icon = "❌"
-                color = "red"
-            else:
-                icon = "ℹ️"
-                color = "gray"
-            
-            # 단계 정보 표시
-            st.markdown(f"**{icon} {step_type}** (Step {i+1})")
+            # 단계별 아이콘 설정 (모듈 레벨 매핑 테이블에서 단일 조회)
+            icon, color = _STEP_STYLE.get(step_type, _DEFAULT_STEP_STYLE)
             
             if step_type == "Error":
+                # 오류는 고유 스타일이 필요하므로 버퍼를 비우고 별도 위젯 사용
+                _flush()
+                st.markdown(f"**{icon} {step_type}** (Step {i+1})")
                 st.error(step_content)
             else:
+                # 단계별 정적 요소를 마크다운 버퍼 하나로 모아 위젯 수 최소화
+                # (Streamlit 위젯 하나당 브라우저 왕복이 발생하므로)
+                buf = [f"**{icon} {step_type}** (Step {i+1})"]
+                
                 # 모델 정보 표시
                 if "model" in step:
-                    model_name = _get_short_model_name(step["model"])
-                    st.caption(f"Model: {model_name}")
+                    buf.append(f"_Model: {_get_short_model_name(step['model'])}_")
                 
                 # 파싱된 결과가 있으면 우선 표시
                 parsed_result = step.get("parsed_result", {})
                 if parsed_result and not parsed_result.get("error", False):
-                    _render_parsed_result(step_type, parsed_result)
+                    buf.extend(_format_parsed_result(step_type, parsed_result))
                 
                 # 원본 내용 표시 (길면 축약) - expander 중첩 방지
                 if step_content and len(step_content) > 50:
-                    st.markdown("**원본 응답:**")
+                    buf.append("**원본 응답:**")
+                    buf.append(f"```text\n{_truncate(step_content, 500)}\n```")
                     if len(step_content) > 500:
-                        st.text(step_content[:500] + "...")
-                        st.caption(f"(전체 {len(step_content)}자 중 500자 표시)")
-                    else:
-                        st.text(step_content)
+                        buf.append(f"_(전체 {len(step_content)}자 중 500자 표시)_")
+                
+                pending.append("\n\n".join(buf))
                 
                 # 검색 결과가 있는 경우 표시
                 if step_type == "Action":
                     search_results = step.get("search_results", parsed_result.get("search_results", []))
                     if search_results:
+                        _flush()
                         _render_search_results(search_results)
-            
-            if i < len(react_steps) - 1:
-                st.divider()
+        
+        _flush()
 
 
-def _render_parsed_result(step_type: str, parsed_result: Dict):
-    """파싱된 결과 표시"""
+def _format_parsed_result(step_type: str, parsed_result: Dict) -> List[str]:
+    """파싱된 결과를 마크다운 라인 목록으로 변환 (단일 st.markdown 호출용)"""
+    lines = []
+    
     if step_type == "Orchestration":
         intent = parsed_result.get("intent", "")
         keywords = parsed_result.get("search_keywords", [])
         confidence = parsed_result.get("confidence", 0)
         
         if intent:
-            st.markdown(f"**의도**: {intent}")
+            lines.append(f"**의도**: {intent}")
         if keywords:
-            st.markdown(f"**검색 키워드**: {', '.join(keywords)}")
+            lines.append(f"**검색 키워드**: {', '.join(keywords)}")
         if confidence:
-            st.markdown(f"**신뢰도**: {confidence:.2f}")
+            lines.append(f"**신뢰도**: {confidence:.2f}")
     
     elif step_type == "Action":
         search_type = parsed_result.get("search_type", "")
         search_keywords = parsed_result.get("search_keywords", [])
         
         if search_type:
-            st.markdown(f"**검색 유형**: {search_type}")
+            lines.append(f"**검색 유형**: {search_type}")
         if search_keywords:
-            st.markdown(f"**사용된 키워드**: {', '.join(search_keywords)}")
+            lines.append(f"**사용된 키워드**: {', '.join(search_keywords)}")
     
     elif step_type == "Observation":
         is_final = parsed_result.get("is_final_answer", False)
         final_answer = parsed_result.get("final_answer", "")
         
         if is_final:
-            st.success("✅ 최종 답변 생성 완료")
+            lines.append("✅ **최종 답변 생성 완료**")
         if final_answer and len(final_answer) > 100:
-            st.markdown("**생성된 답변 미리보기**:")
-            st.text(final_answer[:100] + "...")
+            lines.append("**생성된 답변 미리보기**:")
+            lines.append(f"```text\n{_truncate(final_answer, 100)}\n```")
+    
+    return lines
 
 
 def _render_search_results(search_results: List[Dict]):
-    """검색 결과 표시"""
+    """검색 결과 표시 (전체를 마크다운 1회 방출)"""
     if not search_results:
         st.caption("검색 결과 없음")
         return
     
-    st.caption(f"📚 검색 결과 ({len(search_results)}개)")
+    parts = [f"📚 **검색 결과 ({len(search_results)}개)**"]
     
     for i, result in enumerate(search_results[:3]):  # 상위 3개만 표시
-        score = result.get('score', 0)
-        st.markdown(f"**결과 {i+1}** (점수: {score:.3f})")
+        lines = [f"**결과 {i+1}** (점수: {result.get('score', 0):.3f})"]
         
         content = result.get('content', result.get('text', ''))
         if content:
-            if len(content) > 200:
-                st.text(content[:200] + "...")
-            else:
-                st.text(content)
+            lines.append(f"```text\n{_truncate(content, 200)}\n```")
         
         source = result.get('source', result.get('metadata', {}).get('source', ''))
         if source:
-            st.caption(f"출처: {source}")
+            lines.append(f"_출처: {source}_")
         
-        if i < len(search_results[:3]) - 1:
-            st.markdown("---")
+        parts.append("\n\n".join(lines))
+    
+    st.markdown("\n\n---\n\n".join(parts))
 
 
 def _render_execution_info(message: Dict[str, Any]):
     """실행 정보 표시"""
-    # 메타데이터에서 정보 추출
+    # 메타데이터에서 표시 필드를 한 번에 추출
     metadata = message.get("metadata", {})
-    
     iterations = metadata.get("total_iterations", message.get("iterations_used", 0))
-    max_iterations = 5
+    termination_reason = metadata.get("termination_reason", message.get("termination_reason", ""))
+    total_time = metadata.get("total_time", message.get("execution_time", 0))
+    optimization_level = metadata.get("optimization_level")
+    
+    # 표시할 실행 정보가 전혀 없으면 위젯 생성 자체를 생략
+    if not (iterations or termination_reason or total_time or optimization_level):
+        return
     
     if iterations > 0:
         # 진행률 표시
-        progress = min(iterations / max_iterations, 1.0)
-        st.progress(progress, text=f"ReAct 반복: {iterations}/{max_iterations}회")
+        progress = min(iterations / _MAX_ITERATIONS, 1.0)
+        st.progress(progress, text=f"ReAct 반복: {iterations}/{_MAX_ITERATIONS}회")
     
     # 안전장치 작동 여부 표시
-    termination_reason = metadata.get("termination_reason", message.get("termination_reason", ""))
     if "안전장치" in termination_reason or "중단" in termination_reason:
         st.warning(f"⚠️ {termination_reason}")
     elif termination_reason and termination_reason != "정상 완료":
         st.info(f"ℹ️ {termination_reason}")
     
     # 실행 시간 표시
-    total_time = metadata.get("total_time", message.get("execution_time", 0))
     if total_time > 0:
         st.caption(f"⏱️ 실행 시간: {total_time:.2f}초")
     
     # 최적화 정보 표시
-    if metadata.get("optimization_level"):
-        st.caption(f"🚀 최적화 레벨: {metadata['optimization_level']}")
+    if optimization_level:
+        st.caption(f"🚀 최적화 레벨: {optimization_level}")
 
 
 def _handle_user_input(config: AgentConfig):
     """사용자 입력 처리"""
     # 채팅 입력
     if prompt := st.chat_input("메시지를 입력하세요..."):
-        # 사용자 메시지 추가
-        st.session_state.messages.append({
+        # 사용자 메시지 추가 (포맷 히스토리에도 동일 턴을 증분 기록)
+        user_message = {
+            "id": uuid.uuid4().hex,
             "role": "user", 
             "content": prompt,
             "timestamp": time.time()
-        })
+        }
+        _commit_message(user_message)
         
         # 사용자 메시지 즉시 표시
         with st.chat_message("user"):
@@ -229,35 +382,47 @@ def _handle_user_input(config: AgentConfig):
         
         # Assistant 응답 생성
         with st.chat_message("assistant"):
-            _generate_assistant_response(prompt, config)
+            needs_rerun = _generate_assistant_response(prompt, config)
+        
+        # Legacy 경로는 커밋된 메시지를 히스토리 렌더러가 표시하도록 즉시 rerun
+        # (RerunException이 아래 블랭킷 예외 처리에 삼켜지지 않도록 가드 범위 밖에서 호출)
+        if needs_rerun:
+            st.rerun()
+
 
+def _generate_assistant_response(user_input: str, config: AgentConfig) -> bool:
+    """Assistant 응답 생성 (Strands Agents 또는 Legacy ReAct 사용)
 
-def _generate_assistant_response(user_input: str, config: AgentConfig):
-    """Assistant 응답 생성 (Strands Agents 또는 Legacy ReAct 사용)"""
+    Returns:
+        호출자가 st.rerun()을 수행해야 하면 True
+    """
     try:
         # 시스템 선택 확인
         use_strands = st.session_state.get('use_strands', True)
         
-        # 대화 히스토리 가져오기 (현재 사용자 메시지 제외)
-        all_messages = st.session_state.messages[:-1]  # 마지막 메시지(현재 입력) 제외
-        conversation_history = all_messages[-10:] if len(all_messages) > 0 else []
+        # 세션에 증분 누적된 포맷 히스토리에서 토큰 예산만큼 최신부터 선택
+        # (마지막 항목은 현재 입력이므로 제외, 복사 없이 인덱스 역순 순회)
+        # 오래된 턴의 내용을 바이트 단위로 그대로 보존해야 프롬프트 캐시
+        # prefix가 턴마다 달라지지 않는다
+        entries = st.session_state.get("formatted_history", [])
         
-        # 대화 히스토리를 더 구조화된 형태로 변환
         formatted_history = []
-        for msg in conversation_history:
-            if msg.get("role") in ["user", "assistant"] and msg.get("content"):
-                formatted_history.append({
-                    "role": msg["role"],
-                    "content": str(msg["content"])[:500],  # 문자열로 변환 후 축약
-                    "timestamp": msg.get("timestamp", 0)
-                })
+        budget = _HISTORY_TOKEN_BUDGET
+        for idx in range(len(entries) - 2, -1, -1):
+            msg = entries[idx]
+            cost = _estimate_tokens(msg["content"])
+            if cost > budget:
+                break
+            budget -= cost
+            formatted_history.append(msg)
+        formatted_history.reverse()
         
         if use_strands:
             # Strands Agents 시스템 사용
-            _generate_strands_response(user_input, config, formatted_history)
-        else:
-            # Legacy ReAct 시스템 사용
-            _generate_legacy_response(user_input, config, formatted_history)
+            return _generate_strands_response(user_input, config, formatted_history)
+        
+        # Legacy ReAct 시스템 사용
+        return _generate_legacy_response(user_input, config, formatted_history)
         
     except Exception as e:
         # 에러 처리
@@ -270,161 +435,162 @@ def _generate_assistant_response(user_input: str, config: AgentConfig):
             st.text(f"에러 메시지: {str(e)}")
             
             # 스택 트레이스 표시
-            import traceback
             st.text("스택 트레이스:")
             st.code(traceback.format_exc())
         
         # 에러 응답도 세션에 저장
         error_response = {
+            "id": uuid.uuid4().hex,
             "role": "assistant",
             "content": "죄송합니다. 처리 중 오류가 발생했습니다. 다시 시도해 주세요.",
             "timestamp": time.time(),
             "error": True,
             "error_details": str(e)
         }
-        st.session_state.messages.append(error_response)
+        _commit_message(error_response)
+        return False
 
 
-def _generate_strands_response(user_input: str, config: AgentConfig, formatted_history: List[Dict]):
-    """Strands Agents 시스템으로 응답 생성"""
+def _generate_strands_response(user_input: str, config: AgentConfig, formatted_history: List[Dict]) -> bool:
+    """Strands Agents 시스템으로 응답 생성 (rerun 필요 여부 반환)"""
     try:
-        # Strands를 우선 사용 (안정성 확보)
-        try:
-            from agents.enhanced_mock_strands import EnhancedMockStrandsAgent
-            chatbot = EnhancedMockStrandsAgent(config)
-            strands_type = "Strands Agents"
-            print("✅ Strands Agents 사용 (실제 KB 검색 지원)")
-        except ImportError:
-            # 폴백: 간소화된 구현 사용
-            from agents.strands_adapter_simple import SimpleStrandsCompatibilityAdapter
-            chatbot = SimpleStrandsCompatibilityAdapter(config, use_strands=True)
-            strands_type = "Simple Strands Agents"
-            print("⚠️ Simple Strands Agents 사용")
-        
-        with st.spinner(f"🚀 {strands_type}가 분석하고 있습니다..."):
-            # 진행 상황 표시
-            progress_placeholder = st.empty()
-            
-            progress_placeholder.progress(0.1, text="🎯 Context Analysis: 대화 맥락 분석 중...")
-            time.sleep(0.5)
-            
-            progress_placeholder.progress(0.3, text="🔍 KB Search: Knowledge Base 검색 중...")
-            time.sleep(0.5)
-            
-            progress_placeholder.progress(0.7, text="📝 Answer Generation: 답변 생성 중...")
-            time.sleep(0.5)
-            
-            # Strands 시스템 실행
-            if hasattr(chatbot, 'process_query'):
-                response = chatbot.process_query(user_input, formatted_history)
-            else:
-                response = chatbot.process_query(user_input, formatted_history)
-            
-            progress_placeholder.progress(1.0, text=f"✅ {strands_type} 완료!")
-            time.sleep(0.5)
-            progress_placeholder.empty()
-            
-            # 응답 표시
-            final_answer = response.get("final_answer", response.get("content", "응답을 생성할 수 없습니다."))
-            st.write(final_answer)
-            
-            # Strands 특화 정보 표시
-            _render_strands_info(response)
-            
-            # 응답을 세션에 저장
-            assistant_message = {
-                "role": "assistant",
-                "content": final_answer,
-                "timestamp": time.time(),
-                "steps": response.get("steps", []),
-                "metadata": response.get("model_info", {}),
-                "framework": strands_type,
-                "search_results": response.get("search_results", []),
-                "citations": response.get("citations", []),
-                "iterations": response.get("iterations", 1),
-                "processing_time": response.get("processing_time", 0),
-                "error": False
-            }
-            st.session_state.messages.append(assistant_message)
-            
+        # Strands를 우선 사용 (동일 설정이면 캐시된 인스턴스 재사용)
+        chatbot, strands_type = _get_strands_chatbot(
+            config.orchestration_model,
+            config.action_model,
+            config.observation_model,
+            config.system_prompt,
+            config.temperature,
+            config.max_tokens,
+            config.kb_id,
+            config.kb_description,
+            config.max_iterations,
+            config.max_errors,
+        )
+        
+        # st.status 하나로 진행 상태 표시 (placeholder + progress 프레임 다발 제거)
+        with st.status(f"🚀 {strands_type} 분석 중...", expanded=False) as status:
+            response = chatbot.process_query(user_input, formatted_history)
+            status.update(label=f"✅ {strands_type} 완료", state="complete")
+        
+        # 검색 결과는 수신 시점에 표준 스키마로 정규화 (렌더링/저장 공용)
+        response["search_results"] = _normalize_search_results(
+            response.get("search_results", [])
+        )
+        
+        # 응답 표시
+        final_answer = response.get("final_answer", response.get("content", "응답을 생성할 수 없습니다."))
+        st.write(final_answer)
+        
+        # Strands 특화 정보 표시
+        _render_strands_info(response)
+        
+        # 응답을 세션에 저장
+        assistant_message = {
+            "id": uuid.uuid4().hex,
+            "role": "assistant",
+            "content": final_answer,
+            "timestamp": time.time(),
+            "steps": response.get("steps", []),
+            "metadata": response.get("model_info", {}),
+            "framework": strands_type,
+            "search_results": response.get("search_results", []),
+            "citations": response.get("citations", []),
+            "iterations": response.get("iterations", 1),
+            "processing_time": response.get("processing_time", 0),
+            "error": False
+        }
+        _commit_message(assistant_message)
+        # Strands 특화 정보는 인라인으로 이미 표시했으므로 rerun 불필요
+        return False
+        
     except Exception as e:
         st.error(f"Strands Agents 처리 중 오류가 발생했습니다: {str(e)}")
         # Legacy 시스템으로 폴백
         st.info("🔄 Legacy ReAct 시스템으로 전환합니다...")
-        _generate_legacy_response(user_input, config, formatted_history)
+        return _generate_legacy_response(user_input, config, formatted_history)
 
 
-def _generate_legacy_response(user_input: str, config: AgentConfig, formatted_history: List[Dict]):
-    """Legacy ReAct 시스템으로 응답 생성"""
+def _generate_legacy_response(user_input: str, config: AgentConfig, formatted_history: List[Dict]) -> bool:
+    """Legacy ReAct 시스템으로 응답 생성 (성공 시 True를 반환해 호출자가 rerun)"""
     try:
-        from agents.react_agent import ReActAgent
+        # ReAct Agent 초기화 (동일 설정이면 캐시된 인스턴스 재사용)
+        react_agent = _get_react_agent(
+            config.orchestration_model,
+            config.action_model,
+            config.observation_model,
+            config.system_prompt,
+            config.temperature,
+            config.max_tokens,
+            config.kb_id,
+            config.kb_description,
+            config.max_iterations,
+            config.max_errors,
+        )
         
-        # ReAct Agent 초기화
-        react_agent = ReActAgent(config)
+        # st.status 하나로 단계 이벤트를 표시 (placeholder + progress 프레임 다발 제거)
+        # 실제 ReAct 엔진 실행 (단계 이벤트를 받아 실시간 라벨 갱신)
+        response = {}
+        with st.status("🔄 Legacy ReAct Agent 분석 중...", expanded=False) as status:
+            for event_type, payload in react_agent.run_events(user_input, formatted_history):
+                if event_type == "status":
+                    status.update(label=payload)
+                else:
+                    response = payload
+            status.update(label="✅ Legacy ReAct 완료", state="complete")
+        
+        # 응답 구조 정규화
+        final_answer = response.get("final_answer") or "응답을 생성할 수 없습니다."
+        
+        # 응답 표시 (단계/실행 정보는 rerun 후 히스토리 렌더러가 단일 경로로 표시)
+        st.write(final_answer)
+        
+        react_steps = response.get("steps", [])
+        
+        # 응답을 세션에 저장 (정규화된 형태)
+        assistant_message = {
+            "id": uuid.uuid4().hex,
+            "role": "assistant",
+            "content": final_answer,
+            "timestamp": time.time(),
+            "steps": react_steps,
+            "metadata": response.get("metadata", {}),
+            "framework": "Legacy ReAct",
+            "error": False
+        }
+        _commit_message(assistant_message)
         
-        with st.spinner("🔄 Legacy ReAct Agent가 분석하고 있습니다..."):
-            # 진행 상황 표시
-            progress_placeholder = st.empty()
-            
-            # 실제 ReAct 엔진 실행
-            progress_placeholder.progress(0.1, text="🎯 Orchestration: 쿼리 분석 중...")
-            
-            response = react_agent.run(user_input, formatted_history)
-            
-            progress_placeholder.progress(1.0, text="✅ Legacy ReAct 완료!")
-            time.sleep(0.5)
-            progress_placeholder.empty()
-            
-            # 응답 구조 정규화
-            final_answer = response.get("final_answer", "응답을 생성할 수 없습니다.")
-            
-            # 응답 표시
-            st.write(final_answer)
-            
-            # ReAct 단계 정보 표시
-            react_steps = response.get("steps", [])
-            if react_steps:
-                _render_react_steps(react_steps)
-            
-            # 실행 정보 표시
-            _render_execution_info(response)
-            
-            # 응답을 세션에 저장 (정규화된 형태)
-            assistant_message = {
-                "role": "assistant",
-                "content": final_answer,
-                "timestamp": time.time(),
-                "steps": react_steps,
-                "metadata": response.get("metadata", {}),
-                "framework": "Legacy ReAct",
-                "error": False
-            }
-            st.session_state.messages.append(assistant_message)
-            
     except Exception as e:
         st.error(f"Legacy ReAct 오류: {str(e)}")
         raise e
+    
+    # 방금 저장한 메시지는 rerun 후 히스토리 렌더러가 단일 경로로 표시한다.
+    # st.rerun()은 RerunException 기반이므로 상위 블랭킷 예외 처리 밖에서
+    # 호출되도록 여기서는 필요 여부만 반환한다.
+    return True
 
 
 def _render_strands_info(response: Dict[str, Any]):
     """Strands Agents 특화 정보 표시"""
-    # 처리 시간 및 반복 정보
+    # 처리 시간 및 반복 정보 (표시할 값이 전혀 없으면 컬럼 생성 생략)
     processing_time = response.get("processing_time", 0)
     iterations = response.get("iterations", 1)
+    model_info = response.get("model_info", {})
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if processing_time > 0:
-            st.metric("⏱️ 처리 시간", f"{processing_time:.2f}초")
-    
-    with col2:
-        if iterations > 0:
-            st.metric("🔄 반복 횟수", f"{iterations}회")
-    
-    with col3:
-        framework = response.get("model_info", {}).get("framework", "Strands Agents")
-        st.metric("🚀 프레임워크", framework)
+    if processing_time > 0 or iterations > 0 or model_info:
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            if processing_time > 0:
+                st.metric("⏱️ 처리 시간", f"{processing_time:.2f}초")
+        
+        with col2:
+            if iterations > 0:
+                st.metric("🔄 반복 횟수", f"{iterations}회")
+        
+        with col3:
+            framework = model_info.get("framework", "Strands Agents")
+            st.metric("🚀 프레임워크", framework)
     
     # 검색 결과 정보
     search_results = response.get("search_results", [])
@@ -432,24 +598,24 @@ def _render_strands_info(response: Dict[str, Any]):
         with st.expander("📚 Knowledge Base 검색 결과", expanded=False):
             st.write(f"총 {len(search_results)}개의 관련 문서를 찾았습니다.")
             
-            for i, result in enumerate(search_results[:3]):  # 상위 3개만 표시
+            top_results = search_results[:3]  # 상위 3개만 표시 (슬라이스는 1회만)
+            last_index = len(top_results) - 1
+            for i, result in enumerate(top_results):
                 st.markdown(f"**결과 {i+1}**")
                 
-                score = result.get("score", 0)
+                score = result["score"]
                 st.caption(f"관련성 점수: {score:.3f}")
                 
-                content = result.get("content", "")
+                # 수신 시 정규화된 표준 스키마이므로 직접 접근
+                content = result["content"]
                 if content:
-                    if len(content) > 200:
-                        st.text(content[:200] + "...")
-                    else:
-                        st.text(content)
+                    st.text(_truncate(content, 200))
                 
-                source = result.get("source", "")
+                source = result["source"]
                 if source:
                     st.caption(f"출처: {source}")
                 
-                if i < len(search_results[:3]) - 1:
+                if i < last_index:
                     st.divider()
     
     # Citation 정보
@@ -465,9 +631,9 @@ def _render_strands_info(response: Dict[str, Any]):
                 if score > 0:
                     st.caption(f"관련성: {score:.3f}")
     
-    # 맥락 분석 정보
+    # 맥락 분석 정보 (모든 값이 비어 있으면 expander 생성 생략)
     context_analysis = response.get("context_analysis", {})
-    if context_analysis:
+    if context_analysis and any(context_analysis.values()):
         with st.expander("🧠 대화 맥락 분석", expanded=False):
             col1, col2 = st.columns(2)
             
@@ -487,22 +653,39 @@ def _render_strands_info(response: Dict[str, Any]):
                     st.metric("신뢰도", f"{confidence:.2f}")
 
 
+def _normalize_search_results(results: List[Dict]) -> List[Dict]:
+    """검색 결과를 표준 스키마(content/source/score)로 정규화
+
+    수신 시 1회만 수행하여 렌더링 경로의 .get 폴백 체인 반복을 제거한다.
+    """
+    return [
+        {
+            "content": result.get("content", result.get("text", "")),
+            "source": result.get("source", result.get("metadata", {}).get("source", "")),
+            "score": result.get("score", 0),
+        }
+        for result in results
+    ]
+
+
+def _truncate(s: str, n: int) -> str:
+    """n자 초과 시 말줄임표를 붙여 절단 (이하면 원본 그대로 반환)"""
+    return s if len(s) <= n else s[:n] + "..."
+
+
+def _estimate_tokens(text: str) -> int:
+    """대략적 토큰 수 추정 (한/영 혼합 텍스트 기준 약 4자당 1토큰)"""
+    return len(text) // 4 + 1
+
+
+@lru_cache(maxsize=32)
 def _get_short_model_name(model_id: str) -> str:
-    """모델 ID를 짧은 이름으로 변환"""
+    """모델 ID를 짧은 이름으로 변환 (모델 ID 집합이 작아 결과를 캐시)"""
     if not model_id:
         return "Unknown"
-        
-    if "claude-sonnet-4" in model_id:
-        return "Claude 4"
-    elif "claude-3-7-sonnet" in model_id:
-        return "Claude 3.7"
-    elif "claude-3-5-sonnet" in model_id:
-        return "Claude 3.5 Sonnet"
-    elif "claude-3-5-haiku" in model_id:
-        return "Claude 3.5 Haiku"
-    elif "nova-lite" in model_id:
-        return "Nova Lite"
-    elif "nova-micro" in model_id:
-        return "Nova Micro"
-    else:
-        return model_id.split(':')[0] if ':' in model_id else model_id
+    
+    for marker, short_name in _MODEL_PREFIXES:
+        if marker in model_id:
+            return short_name
+    
+    return model_id.split(':')[0] if ':' in model_id else model_id
@@ -11,6 +11,33 @@ import streamlit as st
 
 from .config import AWS_REGION
 
+# 타임아웃 설정 (모든 클라이언트 공통)
+_CLIENT_CONFIG = Config(
+    read_timeout=120,  # 읽기 타임아웃 120초
+    connect_timeout=60,  # 연결 타임아웃 60초
+    retries={
+        'max_attempts': 3,  # 최대 재시도 3회
+        'mode': 'adaptive'  # 적응형 재시도
+    }
+)
+
+# 리전별 boto3 클라이언트 캐시
+# (클라이언트 생성은 서비스 모델 로딩/엔드포인트 해석으로 수백 ms가 걸리므로 재사용)
+_BEDROCK_RUNTIME_CLIENTS: Dict[str, Any] = {}
+
+
+def _get_bedrock_runtime(region_name: str):
+    """리전별 bedrock-runtime 클라이언트 반환 (커넥션 풀 공유)"""
+    client = _BEDROCK_RUNTIME_CLIENTS.get(region_name)
+    if client is None:
+        client = boto3.client(
+            'bedrock-runtime',
+            region_name=region_name,
+            config=_CLIENT_CONFIG
+        )
+        _BEDROCK_RUNTIME_CLIENTS[region_name] = client
+    return client
+
 
 class BedrockClient:
     """Amazon Bedrock 클라이언트 래퍼"""
@@ -23,21 +50,7 @@ class BedrockClient:
             region_name: AWS 리전명
         """
         try:
-            # 타임아웃 설정 추가
-            config = Config(
-                read_timeout=120,  # 읽기 타임아웃 120초
-                connect_timeout=60,  # 연결 타임아웃 60초
-                retries={
-                    'max_attempts': 3,  # 최대 재시도 3회
-                    'mode': 'adaptive'  # 적응형 재시도
-                }
-            )
-            
-            self.bedrock_runtime = boto3.client(
-                'bedrock-runtime',
-                region_name=region_name,
-                config=config
-            )
+            self.bedrock_runtime = _get_bedrock_runtime(region_name)
             self.region_name = region_name
         except Exception as e:
             st.error(f"Bedrock 클라이언트 초기화 실패: {str(e)}")
@@ -48,7 +61,8 @@ class BedrockClient:
                     prompt: str, 
                     temperature: float = 0.1,
                     max_tokens: int = 4000,
-                    system_prompt: str = "") -> str:
+                    system_prompt: str = "",
+                    cache_system_prompt: bool = False) -> str:
         """
         Bedrock 모델 호출
         
@@ -58,6 +72,8 @@ class BedrockClient:
             temperature: 온도 설정
             max_tokens: 최대 토큰 수
             system_prompt: 시스템 프롬프트
+            cache_system_prompt: 시스템 프롬프트를 Bedrock 프롬프트 캐시에 적재할지 여부
+                (Claude 모델 전용, 반복 호출 간 입력 토큰 재과금 절감)
             
         Returns:
             모델 응답 텍스트
@@ -66,7 +82,7 @@ class BedrockClient:
             # 모델별 요청 형식 구성
             if 'claude' in model_id.lower():
                 body = self._build_claude_request(
-                    prompt, temperature, max_tokens, system_prompt
+                    prompt, temperature, max_tokens, system_prompt, cache_system_prompt
                 )
             elif 'nova' in model_id.lower():
                 body = self._build_nova_request(
@@ -99,7 +115,8 @@ class BedrockClient:
                              prompt: str, 
                              temperature: float, 
                              max_tokens: int,
-                             system_prompt: str) -> Dict[str, Any]:
+                             system_prompt: str,
+                             cache_system_prompt: bool = False) -> Dict[str, Any]:
         """Claude 모델용 요청 구성"""
         
         # Claude API v3 형식 사용
@@ -111,7 +128,16 @@ class BedrockClient:
         
         # System 프롬프트가 있는 경우 별도 필드로 처리
         if system_prompt:
-            request_body["system"] = system_prompt
+            if cache_system_prompt:
+                # 정적 시스템 프롬프트를 캐시 포인트로 표시
+                # (바이트 단위로 동일해야 캐시가 적중하며, 최소 토큰 수 미만이면 무시됨)
+                request_body["system"] = [{
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            else:
+                request_body["system"] = system_prompt
         
         # Messages 배열에는 user 메시지만 포함
         request_body["messages"] = [
@@ -7,9 +7,9 @@ from typing import Optional
 import streamlit as st
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
-    """ReAct Agent 설정 클래스"""
+    """ReAct Agent 설정 클래스 (불변, __dict__ 없는 슬롯 기반 인스턴스)"""
     
     # 모델 설정 (필수 필드)
     orchestration_model: str
@@ -33,16 +33,21 @@ class AgentConfig:
     
     @classmethod
     def from_streamlit_session(cls) -> 'AgentConfig':
-        """Streamlit 세션 상태에서 설정 로드"""
+        """Streamlit 세션 상태에서 설정 로드
+
+        session_state 프록시를 키마다 조회하지 않고 일반 dict로 1회
+        스냅샷한 뒤 읽는다.
+        """
+        session = dict(st.session_state)
         return cls(
-            orchestration_model=st.session_state.get('orchestration_model', 'us.anthropic.claude-3-5-haiku-20241022-v1:0'),
-            action_model=st.session_state.get('action_model', 'us.amazon.nova-micro-v1:0'),  # 경제적 조합
-            observation_model=st.session_state.get('observation_model', 'us.anthropic.claude-3-5-haiku-20241022-v1:0'),
-            system_prompt=st.session_state.get('system_prompt', ''),
-            temperature=st.session_state.get('temperature', 0.1),
-            max_tokens=st.session_state.get('max_tokens', 4000),
-            kb_id=st.session_state.get('kb_id'),
-            kb_description=st.session_state.get('kb_description', ''),  # KB 설명 추가
+            orchestration_model=session.get('orchestration_model', 'us.anthropic.claude-3-5-haiku-20241022-v1:0'),
+            action_model=session.get('action_model', 'us.amazon.nova-micro-v1:0'),  # 경제적 조합
+            observation_model=session.get('observation_model', 'us.anthropic.claude-3-5-haiku-20241022-v1:0'),
+            system_prompt=session.get('system_prompt', ''),
+            temperature=session.get('temperature', 0.1),
+            max_tokens=session.get('max_tokens', 4000),
+            kb_id=session.get('kb_id'),
+            kb_description=session.get('kb_description', ''),  # KB 설명 추가
         )
     
     @classmethod
@@ -60,7 +65,11 @@ class AgentConfig:
         )
     
     def get_max_tokens_for_model(self, model_id: str) -> int:
-        """모델별 최대 토큰 수 반환"""
+        """모델별 최대 토큰 수 반환 (사전 계산된 제한 테이블 조회)"""
+        limit = MODEL_MAX_TOKENS.get(model_id)
+        if limit is not None:
+            return min(self.max_tokens, limit)
+        # 목록에 없는 모델은 기존 부분 문자열 휴리스틱 유지
         if 'claude' in model_id.lower():
             return min(self.max_tokens, 8000)
         elif 'nova' in model_id.lower():
@@ -82,23 +91,16 @@ class AgentConfig:
     
     def validate_model_selection(self) -> bool:
         """모델 선택 유효성 검증"""
-        # Claude 모델 목록
-        claude_models = [
-            'us.anthropic.claude-sonnet-4-20250514-v1:0',
-            'us.anthropic.claude-3-7-sonnet-20250219-v1:0',
-            'us.anthropic.claude-3-5-sonnet-20241022-v2:0',
-            'us.anthropic.claude-3-5-haiku-20241022-v1:0'
-        ]
-        
         # Orchestration과 Observation은 Claude 모델만 허용
-        if self.orchestration_model not in claude_models:
+        if self.orchestration_model not in CLAUDE_MODEL_ID_SET:
             return False
-        if self.observation_model not in claude_models:
+        if self.observation_model not in CLAUDE_MODEL_ID_SET:
             return False
             
         return True
     
-    def get_model_recommendations(self) -> dict:
+    @staticmethod
+    def get_model_recommendations() -> dict:
         """권장 모델 조합 반환"""
         return {
             "high_performance": {
@@ -132,6 +134,14 @@ AVAILABLE_MODELS = {
     "Nova Micro": "us.amazon.nova-micro-v1:0"
 }
 
+# 모델 ID -> 표시명 역방향 매핑 (모듈 로드 시 1회 구성)
+MODEL_ID_TO_NAME = {model_id: name for name, model_id in AVAILABLE_MODELS.items()}
+
+# Claude 계열 모델 ID 집합 (validate_model_selection에서 O(1) 멤버십 검사)
+CLAUDE_MODEL_ID_SET = frozenset(
+    model_id for name, model_id in AVAILABLE_MODELS.items() if name.startswith("Claude")
+)
+
 # 모델별 특성 정의
 MODEL_CHARACTERISTICS = {
     "Claude Sonnet 4": {
@@ -184,6 +194,17 @@ MODEL_CHARACTERISTICS = {
     }
 }
 
+# 모델 ID별 파생 정보 (매 호출 시 소문자 변환/부분 문자열 검사 방지)
+MODEL_IS_NOVA = {
+    model_id: characteristics["type"] == "nova"
+    for name, model_id in AVAILABLE_MODELS.items()
+    for characteristics in (MODEL_CHARACTERISTICS[name],)
+}
+MODEL_MAX_TOKENS = {
+    model_id: MODEL_CHARACTERISTICS[name]["max_tokens"]
+    for name, model_id in AVAILABLE_MODELS.items()
+}
+
 # AWS 리전
 AWS_REGION = "us-west-2"
 
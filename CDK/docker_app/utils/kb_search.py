@@ -2,7 +2,16 @@
 Amazon Bedrock Knowledge Base 검색 유틸리티
 """
 
+import asyncio
 import boto3
+import copy
+import hashlib
+import heapq
+import re
+import threading
+import time
+from operator import itemgetter
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Dict, Optional
 from botocore.exceptions import ClientError
 from botocore.config import Config
@@ -10,43 +19,129 @@ import streamlit as st
 
 from .config import AWS_REGION, KB_DEFAULT_CONFIG
 
+# 다중 쿼리 검색용 공유 스레드 풀
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="kb-query")
+
+# 쿼리/본문 정규화용 공백 패턴 (모듈 로드 시 1회 컴파일)
+_WS_RE = re.compile(r'\s+')
+
+
+def _default_report(level: str, message: str) -> None:
+    """기본 사용자 알림 — Streamlit 요소로 표시 (메인 스레드 호출 전제)"""
+    getattr(st, level)(message)
+
+# 리전별 bedrock-agent-runtime 클라이언트 캐시 (생성 비용 아모타이즈 + 커넥션 풀 공유)
+_AGENT_RUNTIME_CLIENTS: Dict[str, object] = {}
+_AGENT_RUNTIME_CONFIG = Config(
+    read_timeout=120,  # 읽기 타임아웃 120초
+    connect_timeout=60,  # 연결 타임아웃 60초
+    max_pool_connections=16,  # 병렬 다중 쿼리가 기본 풀(10)에서 직렬화되지 않도록 확장
+    retries={
+        'max_attempts': 3,  # 최대 재시도 3회
+        'mode': 'adaptive'  # 적응형 재시도
+    }
+)
+
+
+# 진행 중인 동일 검색 병합용 테이블 (선두 호출만 Bedrock에 나가고 나머지는 결과 대기)
+_INFLIGHT_SEARCHES: Dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# 검색 결과 TTL 캐시 (동일 쿼리의 Bedrock 재호출 방지, 워커 스레드에서 접근하므로 락 보호)
+_SEARCH_CACHE: Dict[tuple, tuple] = {}
+_SEARCH_CACHE_LOCK = threading.Lock()
+_SEARCH_CACHE_TTL = 300  # 초
+_SEARCH_CACHE_MAX = 256
+
+
+def _search_cache_get(key: tuple) -> Optional[List[Dict]]:
+    """캐시 조회 — 만료 항목은 제거, 히트 시 호출자 변형 방지를 위해 복사본 반환"""
+    with _SEARCH_CACHE_LOCK:
+        entry = _SEARCH_CACHE.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if expires_at < time.monotonic():
+            del _SEARCH_CACHE[key]
+            return None
+    return copy.deepcopy(results)
+
+
+def _search_cache_put(key: tuple, results: List[Dict]) -> None:
+    """캐시 저장 — 용량 초과 시 가장 오래된 항목부터 제거"""
+    snapshot = copy.deepcopy(results)
+    with _SEARCH_CACHE_LOCK:
+        while len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAX:
+            _SEARCH_CACHE.pop(next(iter(_SEARCH_CACHE)))
+        _SEARCH_CACHE[key] = (time.monotonic() + _SEARCH_CACHE_TTL, snapshot)
+
+
+# 리전별 bedrock-agent(제어부) 클라이언트 캐시 — 연결 테스트 전용, 지연 생성
+_AGENT_CONTROL_CLIENTS: Dict[str, object] = {}
+
+# KB 연결 상태 메모 (리런마다 재프로브하지 않도록 60초 유지)
+_KB_STATUS_CACHE: Dict[tuple, tuple] = {}
+_KB_STATUS_TTL = 60  # 초
+
+
+def _get_agent_control(region_name: str):
+    """리전별 bedrock-agent 클라이언트 반환 (get_knowledge_base 등 메타데이터 호출용)"""
+    client = _AGENT_CONTROL_CLIENTS.get(region_name)
+    if client is None:
+        client = boto3.client('bedrock-agent', region_name=region_name)
+        _AGENT_CONTROL_CLIENTS[region_name] = client
+    return client
+
+
+def _get_agent_runtime(region_name: str):
+    """리전별 bedrock-agent-runtime 클라이언트 반환"""
+    client = _AGENT_RUNTIME_CLIENTS.get(region_name)
+    if client is None:
+        client = boto3.client(
+            'bedrock-agent-runtime',
+            region_name=region_name,
+            config=_AGENT_RUNTIME_CONFIG
+        )
+        _AGENT_RUNTIME_CLIENTS[region_name] = client
+    return client
+
 
 class KnowledgeBaseSearcher:
     """Amazon Bedrock Knowledge Base 검색 클래스"""
     
-    def __init__(self, region_name: str = AWS_REGION):
+    # 위치 타입 -> (하위 키, 필드, 표시 접두어) 디스패치 테이블 (if/elif 체인 제거)
+    _LOC_DISPATCH = {
+        'S3': ('s3Location', 'uri', 'S3'),
+        'WEB': ('webLocation', 'url', 'Web'),
+        'CONFLUENCE': ('confluenceLocation', 'url', 'Confluence'),
+    }
+    
+    def __init__(self, region_name: str = AWS_REGION, report=None):
         """
         KB 검색 클라이언트 초기화
         
         Args:
             region_name: AWS 리전명
+            report: (level, message)를 받는 알림 콜백 — 미지정 시 Streamlit 표시.
+                워커 스레드에서 쓸 때는 세션 컨텍스트가 없으므로 로거 기반 콜백을 전달한다.
         """
+        # 핫패스에서 Streamlit 내부를 직접 건드리지 않도록 보고 경로를 주입 가능하게 분리
+        self._report = report or _default_report
         try:
-            # 타임아웃 설정 추가
-            config = Config(
-                read_timeout=120,  # 읽기 타임아웃 120초
-                connect_timeout=60,  # 연결 타임아웃 60초
-                retries={
-                    'max_attempts': 3,  # 최대 재시도 3회
-                    'mode': 'adaptive'  # 적응형 재시도
-                }
-            )
-            
-            self.bedrock_agent_runtime = boto3.client(
-                'bedrock-agent-runtime',
-                region_name=region_name,
-                config=config
-            )
+            self.bedrock_agent_runtime = _get_agent_runtime(region_name)
+            # 서비스별 예외 클래스 핸들 (문자열 코드 비교 대신 C 레벨 예외 매칭)
+            self._exceptions = self.bedrock_agent_runtime.exceptions
             self.region_name = region_name
         except Exception as e:
-            st.error(f"Bedrock Agent Runtime 클라이언트 초기화 실패: {str(e)}")
+            self._report('error', f"Bedrock Agent Runtime 클라이언트 초기화 실패: {str(e)}")
             raise
     
     def search(self, 
               kb_id: str, 
               query: str, 
               max_results: int = KB_DEFAULT_CONFIG["max_results"],
-              search_type: str = KB_DEFAULT_CONFIG["search_type"]) -> List[Dict]:
+              search_type: str = KB_DEFAULT_CONFIG["search_type"],
+              report=None) -> List[Dict]:
         """
         Knowledge Base에서 검색 수행
         
@@ -55,14 +150,44 @@ class KnowledgeBaseSearcher:
             query: 검색 쿼리
             max_results: 최대 결과 수
             search_type: 검색 타입 (SEMANTIC, HYBRID) - 현재 API에서는 사용되지 않음
+            report: 이 호출에 한해 기본 알림 콜백을 대체 (워커 스레드 디스패치용)
             
         Returns:
             검색 결과 리스트
         """
+        if report is None:
+            report = self._report
         if not kb_id or not kb_id.strip():
-            st.warning("Knowledge Base ID가 설정되지 않았습니다.")
+            report('warning', "Knowledge Base ID가 설정되지 않았습니다.")
             return []
         
+        # TTL 캐시 조회 (오류/빈 결과는 캐시하지 않으므로 재시도 가능)
+        cache_key = (self.region_name, kb_id, query.strip().casefold(), max_results, search_type)
+        cached = _search_cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # 동일 키 검색이 이미 진행 중이면 새 호출을 만들지 않고 그 결과를 공유
+        with _INFLIGHT_LOCK:
+            inflight = _INFLIGHT_SEARCHES.get(cache_key)
+            if inflight is None:
+                future = Future()
+                _INFLIGHT_SEARCHES[cache_key] = future
+        if inflight is not None:
+            return copy.deepcopy(inflight.result())
+        
+        results: List[Dict] = []
+        try:
+            results = self._search_uncached(kb_id, query, max_results, cache_key, report)
+            return results
+        finally:
+            with _INFLIGHT_LOCK:
+                _INFLIGHT_SEARCHES.pop(cache_key, None)
+            # 대기자에게는 선두 호출자의 후속 변형과 격리된 스냅샷을 공유
+            future.set_result(copy.deepcopy(results))
+    
+    def _search_uncached(self, kb_id: str, query: str, max_results: int, cache_key: tuple, report) -> List[Dict]:
+        """캐시/병합 계층을 거치지 않는 실제 retrieve 호출"""
         try:
             # API 파라미터 구조 수정 - overrideSearchType 제거
             response = self.bedrock_agent_runtime.retrieve(
@@ -75,37 +200,62 @@ class KnowledgeBaseSearcher:
                 }
             )
             
-            search_results = []
-            for i, result in enumerate(response.get('retrievalResults', [])):
-                search_result = {
-                    'rank': i + 1,
-                    'citation_id': i + 1,  # Citation 번호 추가
-                    'content': result.get('content', {}).get('text', ''),
+            # 단일 컴프리헨션으로 결과 구성 (메서드 재조회와 append 호출 제거)
+            _extract = self._extract_source
+            search_results = [
+                {
+                    'rank': i,
+                    'citation_id': i,  # Citation 번호 추가
+                    'content': (result.get('content') or {}).get('text', ''),
                     'score': result.get('score', 0.0),
-                    'source': self._extract_source(result),
-                    'metadata': result.get('metadata', {})
+                    'source': _extract(result),
+                    'metadata': result.get('metadata') or {}
                 }
-                search_results.append(search_result)
+                for i, result in enumerate(response.get('retrievalResults') or (), 1)
+            ]
             
+            if search_results:
+                _search_cache_put(cache_key, search_results)
             return search_results
             
+        except self._exceptions.ResourceNotFoundException:
+            report('error', f"Knowledge Base를 찾을 수 없습니다: {kb_id}")
+            return []
+            
+        except self._exceptions.AccessDeniedException:
+            report('error', "Knowledge Base 접근 권한이 없습니다.")
+            return []
+            
         except ClientError as e:
             error_code = e.response['Error']['Code']
             error_message = e.response['Error']['Message']
-            
-            if error_code == 'ResourceNotFoundException':
-                st.error(f"Knowledge Base를 찾을 수 없습니다: {kb_id}")
-            elif error_code == 'AccessDeniedException':
-                st.error("Knowledge Base 접근 권한이 없습니다.")
-            else:
-                st.error(f"KB 검색 오류 ({error_code}): {error_message}")
-            
+            report('error', f"KB 검색 오류 ({error_code}): {error_message}")
             return []
             
         except Exception as e:
-            st.error(f"KB 검색 중 예상치 못한 오류: {str(e)}")
+            report('error', f"KB 검색 중 예상치 못한 오류: {str(e)}")
             return []
     
+    async def asearch(self,
+                     kb_id: str,
+                     query: str,
+                     max_results: int = KB_DEFAULT_CONFIG["max_results"],
+                     search_type: str = KB_DEFAULT_CONFIG["search_type"]) -> List[Dict]:
+        """search의 비동기 래퍼 (블로킹 retrieve 호출을 워커 스레드로 위임)
+
+        aioboto3 없이도 이벤트 루프를 막지 않도록 asyncio.to_thread를 사용한다.
+        """
+        return await asyncio.to_thread(self.search, kb_id, query, max_results, search_type)
+    
+    async def asearch_multiple_queries(self,
+                                       kb_id: str,
+                                       queries: List[str],
+                                       max_results_per_query: int = 3) -> List[Dict]:
+        """search_multiple_queries의 비동기 래퍼"""
+        return await asyncio.to_thread(
+            self.search_multiple_queries, kb_id, queries, max_results_per_query
+        )
+    
     def search_multiple_queries(self, 
                                kb_id: str, 
                                queries: List[str],
@@ -121,71 +271,108 @@ class KnowledgeBaseSearcher:
         Returns:
             통합된 검색 결과 (중복 제거 및 점수순 정렬)
         """
-        all_results = []
-        seen_contents = set()
-        
+        # 분해된 하위 쿼리는 어휘 변형(공백/대소문자)으로 겹치는 일이 잦다.
+        # 정규화 키로 선제 중복 제거해 동일 쿼리의 retrieve 호출 자체를 줄인다.
+        valid_queries = []
+        seen_query_keys = set()
         for query in queries:
-            if not query.strip():
+            stripped = query.strip()
+            if not stripped:
                 continue
-                
-            results = self.search(
-                kb_id=kb_id,
-                query=query,
-                max_results=max_results_per_query
-            )
-            
-            # 중복 제거
+            query_key = _WS_RE.sub(' ', stripped).casefold()
+            if query_key in seen_query_keys:
+                continue
+            seen_query_keys.add(query_key)
+            valid_queries.append(stripped)
+        if not valid_queries:
+            return []
+
+        # 독립적인 쿼리들을 병렬로 실행 (결과 순서는 쿼리 순서 유지)
+        if len(valid_queries) == 1:
+            results_per_query = [self.search(kb_id=kb_id, query=valid_queries[0], max_results=max_results_per_query)]
+        else:
+            # 워커 스레드에는 Streamlit 세션 컨텍스트가 없으므로 알림을 직접
+            # 내보내지 않고 수집했다가 호출 스레드에서 재생한다
+            captured_reports: List[tuple] = []
+            capture_lock = threading.Lock()
+
+            def _capture_report(level: str, message: str) -> None:
+                with capture_lock:
+                    captured_reports.append((level, message))
+
+            results_per_query = list(_SEARCH_EXECUTOR.map(
+                lambda query: self.search(
+                    kb_id=kb_id,
+                    query=query,
+                    max_results=max_results_per_query,
+                    report=_capture_report
+                ),
+                valid_queries
+            ))
+
+            # 동일 오류가 쿼리 수만큼 반복되지 않도록 중복 제거 후 보고
+            for level, message in dict.fromkeys(captured_reports):
+                self._report(level, message)
+
+        all_results = []
+        seen_contents = set()
+
+        for query, results in zip(valid_queries, results_per_query):
+            # 중복 제거 — 공백/대소문자 정규화 후 안정적 지문으로 판단
+            # (salt가 섞이는 내장 hash()와 달리 프로세스 간에도 동일한 키)
             for result in results:
-                content_hash = hash(result['content'][:100])  # 첫 100자로 중복 판단
+                normalized = _WS_RE.sub(' ', result['content'][:256]).casefold()
+                content_hash = hashlib.blake2b(normalized.encode(), digest_size=8).digest()
                 if content_hash not in seen_contents:
                     result['query'] = query  # 어떤 쿼리로 찾았는지 기록
                     all_results.append(result)
                     seen_contents.add(content_hash)
         
-        # 점수순으로 정렬하고 상위 5개만 반환
-        all_results.sort(key=lambda x: x['score'], reverse=True)
-        return all_results[:KB_DEFAULT_CONFIG["max_results"]]
+        # 전체 정렬 대신 상위 k개만 선별 (O(M log M) -> O(M log k))
+        return heapq.nlargest(KB_DEFAULT_CONFIG["max_results"], all_results, key=itemgetter('score'))
     
     def _extract_source(self, retrieval_result: Dict) -> str:
-        """검색 결과에서 소스 정보 추출"""
+        """검색 결과에서 소스 정보 추출 (디스패치 테이블 단일 조회)"""
         try:
-            location = retrieval_result.get('location', {})
+            location = retrieval_result.get('location') or {}
             location_type = location.get('type', 'UNKNOWN')
             
-            if location_type == 'S3':
-                s3_location = location.get('s3Location', {})
-                uri = s3_location.get('uri', 'Unknown S3 Location')
-                return f"S3: {uri}"
-            
-            elif location_type == 'WEB':
-                web_location = location.get('webLocation', {})
-                url = web_location.get('url', 'Unknown Web Location')
-                return f"Web: {url}"
-            
-            elif location_type == 'CONFLUENCE':
-                confluence_location = location.get('confluenceLocation', {})
-                url = confluence_location.get('url', 'Unknown Confluence Location')
-                return f"Confluence: {url}"
-            
-            else:
+            dispatch = self._LOC_DISPATCH.get(location_type)
+            if dispatch is None:
                 return f"{location_type}: Unknown Location"
+            
+            sub_key, field, prefix = dispatch
+            # 행복 경로가 지배적이므로 기본값 dict 할당 대신 직접 인덱싱(EAFP)
+            try:
+                return f"{prefix}: {location[sub_key][field]}"
+            except (KeyError, TypeError):
+                return f"{prefix}: Unknown {prefix} Location"
                 
         except Exception as e:
             return f"Source extraction error: {str(e)}"
     
     def test_kb_connection(self, kb_id: str) -> bool:
-        """Knowledge Base 연결 테스트"""
+        """Knowledge Base 연결 테스트
+
+        벡터 검색을 태우는 대신 bedrock-agent의 get_knowledge_base로
+        존재/권한만 확인한다 (검색 비용 없이 수 배 빠름). 결과는 60초 메모.
+        """
         if not kb_id or not kb_id.strip():
             return False
         
+        status_key = (self.region_name, kb_id)
+        entry = _KB_STATUS_CACHE.get(status_key)
+        if entry is not None and entry[0] >= time.monotonic():
+            return entry[1]
+        
         try:
-            # 간단한 테스트 검색
-            results = self.search(
-                kb_id=kb_id,
-                query="test",
-                max_results=1
-            )
-            return True  # 오류가 없으면 연결 성공
+            _get_agent_control(self.region_name).get_knowledge_base(knowledgeBaseId=kb_id)
+            connected = True
+        except ClientError:
+            connected = False
         except Exception as e:
-            st.error(f"KB 연결 테스트 실패: {str(e)}")
+            self._report('error', f"KB 연결 테스트 실패: {str(e)}")
             return False
+        
+        _KB_STATUS_CACHE[status_key] = (time.monotonic() + _KB_STATUS_TTL, connected)
+        return connected
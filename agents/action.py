@@ -40,12 +40,14 @@ class ActionAgent:
             Action 결과
         """
         try:
-            # 가장 최근 Orchestration 결과 찾기
-            orchestration_result = None
-            for step in reversed(previous_steps):
-                if step.get("type") == "Orchestration":
-                    orchestration_result = step
-                    break
+            # 가장 최근 Orchestration 결과: run 루프가 기록한 직접 참조 사용
+            # (context에 없으면 기존 역방향 스캔으로 폴백)
+            orchestration_result = context.get("last_orchestration_step")
+            if orchestration_result is None:
+                for step in reversed(previous_steps):
+                    if step.get("type") == "Orchestration":
+                        orchestration_result = step
+                        break
             
             if not orchestration_result:
                 return self._create_error_response("Orchestration 결과를 찾을 수 없습니다.", [])
@@ -4,10 +4,27 @@ KB 검색 결과에 대한 명확한 Citation 표시
 """
 
 import json
+import re
 from typing import Dict, List, Any
 from utils.config import AgentConfig
 from utils.bedrock_client import BedrockClient
 
+# 연속성 질문 / 인사말 판별용 키워드 (모듈 로드 시 1회 컴파일)
+_CONTINUATION_PATTERNS = (
+    "다음은", "그럼", "그러면", "또는", "아니면", "그리고", "그런데",
+    "그래서", "그렇다면", "계속", "이어서", "추가로", "더", "또", "그 외에"
+)
+_CONTINUATION_RE = re.compile("|".join(map(re.escape, _CONTINUATION_PATTERNS)))
+
+_GREETING_PATTERNS = (
+    "안녕", "hello", "hi", "hey", "안녕하세요", "안녕하십니까",
+    "좋은 아침", "좋은 오후", "좋은 저녁", "반갑습니다"
+)
+_GREETING_RE = re.compile("|".join(map(re.escape, _GREETING_PATTERNS)))
+
+# 한글 단어 추출 패턴
+_KOREAN_WORD_RE = re.compile(r'[가-힣]+')
+
 
 class CitationEnhancedObservationAgent:
     """
@@ -26,18 +43,20 @@ class CitationEnhancedObservationAgent:
     def observe(self, context: Dict, previous_steps: List) -> Dict:
         """Citation이 강화된 결과 분석 및 다음 단계 결정"""
         try:
-            # 가장 최근 Action 결과 찾기
-            action_result = None
-            orchestration_result = None
-            
-            for step in reversed(previous_steps):
-                if step.get("type") == "Action" and action_result is None:
-                    action_result = step
-                elif step.get("type") == "Orchestration" and orchestration_result is None:
-                    orchestration_result = step
-                
-                if action_result and orchestration_result:
-                    break
+            # 가장 최근 Action/Orchestration 결과: run 루프가 기록한 직접 참조 사용
+            # (다른 호출 경로에서 context에 없으면 기존 역방향 스캔으로 폴백)
+            action_result = context.get("last_action_step")
+            orchestration_result = context.get("last_orchestration_step")
+            
+            if orchestration_result is None:
+                for step in reversed(previous_steps):
+                    if step.get("type") == "Action" and action_result is None:
+                        action_result = step
+                    elif step.get("type") == "Orchestration" and orchestration_result is None:
+                        orchestration_result = step
+                    
+                    if action_result and orchestration_result:
+                        break
             
             # Orchestration에서 맥락 정보 추출
             context_info = self._extract_context_info(orchestration_result)
@@ -53,7 +72,7 @@ class CitationEnhancedObservationAgent:
             
             # 검색 결과가 있는 경우 - Citation 강화
             if search_results and not action_error:
-                return self._analyze_search_results_with_enhanced_citation(search_results, context, search_keywords, context_info)
+                return self._analyze_search_results_with_enhanced_citation(search_results, context, search_keywords, context_info, previous_steps)
             
             # 검색 결과가 없지만 오류가 아닌 경우
             elif not search_results and not action_error:
@@ -78,7 +97,20 @@ class CitationEnhancedObservationAgent:
                 "error": True
             }
     
-    def _analyze_search_results_with_enhanced_citation(self, search_results: List[Dict], context: Dict, search_keywords: List[str], context_info: Dict) -> Dict:
+    @staticmethod
+    def _format_history(history: List[Dict], n: int, truncate: int, user_label: str, assistant_label: str) -> str:
+        """최근 대화 이력을 프롬프트용 텍스트로 변환 (list + join으로 단일 할당)"""
+        parts = []
+        for msg in history[-n:]:
+            role = msg.get("role", "")
+            content = msg.get("content", "")
+            if role == "user":
+                parts.append(f"{user_label}: {content}\n")
+            elif role == "assistant":
+                parts.append(f"{assistant_label}: {content[:truncate]}...\n")
+        return "".join(parts)
+
+    def _analyze_search_results_with_enhanced_citation(self, search_results: List[Dict], context: Dict, search_keywords: List[str], context_info: Dict, previous_steps: List) -> Dict:
         """Citation이 강화된 검색 결과 분석"""
         try:
             original_query = context.get("original_query", "")
@@ -103,9 +135,10 @@ class CitationEnhancedObservationAgent:
                 enhanced_result['citation_id'] = citation_id
                 results_with_citations.append(enhanced_result)
             
-            # 현재 반복 횟수 확인 (previous_steps에서 Action 단계 수 계산)
-            previous_steps = context.get("previous_steps", [])
-            action_count = sum(1 for step in previous_steps if step.get("type") == "Action")
+            # 현재 반복 횟수 확인 (run 루프가 기록한 카운터, 없으면 Action 단계 수 계산)
+            action_count = context.get("action_count") or sum(
+                1 for step in previous_steps if step.get("type") == "Action"
+            )
             current_iteration = action_count
             
             print(f"   📊 현재 반복: {current_iteration}회차, 검색 결과: {len(search_results)}개")
@@ -141,21 +174,16 @@ class CitationEnhancedObservationAgent:
             # 최종 답변 생성 (5회차이거나 품질이 충분한 경우)
             print(f"   ✅ 최종 답변 생성 (반복: {current_iteration}, 품질 충족: {not quality_assessment['needs_retry']})")
             
-            # 검색 결과 텍스트 구성 (Citation 포함)
-            results_text = ""
-            for citation in citations:
-                content = citation['content'][:400]  # 400자로 제한
-                results_text += f"[{citation['id']}] {content}...\n출처: {citation['source']}\n\n"
+            # 검색 결과 텍스트 구성 (Citation 포함, list + join으로 단일 할당)
+            results_text = "".join(
+                f"[{citation['id']}] {citation['content'][:400]}...\n출처: {citation['source']}\n\n"
+                for citation in citations
+            )
             
             # 이전 대화 맥락
             previous_context = ""
             if context_info.get("has_context", False) and conversation_history:
-                recent_messages = conversation_history[-2:]
-                for msg in recent_messages:
-                    if msg.get("role") == "user":
-                        previous_context += f"이전 질문: {msg.get('content', '')}\n"
-                    elif msg.get("role") == "assistant":
-                        previous_context += f"이전 답변: {msg.get('content', '')[:150]}...\n"
+                previous_context = self._format_history(conversation_history, 2, 150, "이전 질문", "이전 답변")
             
             # Citation 강화 프롬프트 (최종 답변용)
             if current_iteration >= 5:
@@ -203,7 +231,8 @@ Knowledge Base 검색 결과:
                 prompt=prompt,
                 temperature=self.config.temperature,
                 max_tokens=self.config.get_max_tokens_for_model(self.config.observation_model),
-                system_prompt=self._get_citation_system_prompt()
+                system_prompt=self._get_citation_system_prompt(),
+                cache_system_prompt=True
             )
             
             # Citation 정보가 포함되지 않은 경우 자동 추가
@@ -235,25 +264,15 @@ Knowledge Base 검색 결과:
     
     def _ensure_citations_in_response(self, response: str, citations: List[Dict]) -> str:
         """응답에 Citation이 포함되어 있는지 확인하고 없으면 추가"""
-        # Citation 패턴 확인
-        import re
-        citation_pattern = r'\[\d+\]'
-        has_citations = bool(re.search(citation_pattern, response))
-        
         # 참고 자료 섹션 확인
         has_references = "참고 자료" in response or "References" in response or "출처" in response
         
-        if not has_citations or not has_references:
+        if not has_references:
             # Citation 자동 추가
-            enhanced_response = response
-            
-            if not has_references:
-                enhanced_response += "\n\n**참고 자료:**\n"
-                for citation in citations:
-                    enhanced_response += f"[{citation['id']}] {citation['source']}\n"
-            
-            return enhanced_response
-        
+            reference_lines = [response, "\n\n**참고 자료:**\n"]
+            reference_lines.extend(f"[{citation['id']}] {citation['source']}\n" for citation in citations)
+            return "".join(reference_lines)
+
         return response
     
     def _get_citation_system_prompt(self) -> str:
@@ -307,19 +326,10 @@ Knowledge Base 검색 결과:
     def _generate_context_aware_answer(self, query: str, history: List[Dict], context_info: Dict) -> Dict:
         """맥락을 고려한 답변 생성 - 대화 연속성 강화"""
         try:
-            # 이전 대화에서 맥락 추출 (더 많은 대화 포함)
+            # 이전 대화에서 맥락 추출 (최근 6개, 이전 답변은 500자까지 포함)
             previous_context = ""
             if history:
-                # 최근 6개 메시지까지 포함 (더 풍부한 맥락)
-                recent_messages = history[-6:]
-                for msg in recent_messages:
-                    role = msg.get("role", "")
-                    content = msg.get("content", "")
-                    if role == "user":
-                        previous_context += f"사용자: {content}\n"
-                    elif role == "assistant":
-                        # 이전 답변을 더 길게 포함 (500자까지)
-                        previous_context += f"어시스턴트: {content[:500]}...\n"
+                previous_context = self._format_history(history, 6, 500, "사용자", "어시스턴트")
             
             # 연속성 질문 감지
             is_continuation = self._is_conversation_continuation_question(query)
@@ -358,7 +368,8 @@ Knowledge Base 검색 결과:
                 prompt=prompt,
                 temperature=self.config.temperature,
                 max_tokens=min(2000, self.config.get_max_tokens_for_model(self.config.observation_model)),  # 더 긴 답변 허용
-                system_prompt=self._get_conversation_system_prompt()
+                system_prompt=self._get_conversation_system_prompt(),
+                cache_system_prompt=True
             )
             
             return self._create_final_response(
@@ -371,13 +382,7 @@ Knowledge Base 검색 결과:
     
     def _is_conversation_continuation_question(self, query: str) -> bool:
         """대화 연속성 질문인지 확인"""
-        continuation_patterns = [
-            "다음은", "그럼", "그러면", "또는", "아니면", "그리고", "그런데",
-            "그래서", "그렇다면", "계속", "이어서", "추가로", "더", "또", "그 외에"
-        ]
-        
-        query_lower = query.lower().strip()
-        return any(pattern in query_lower for pattern in continuation_patterns)
+        return bool(_CONTINUATION_RE.search(query.lower().strip()))
     
     def _get_conversation_system_prompt(self) -> str:
         """대화 맥락 인식 시스템 프롬프트"""
@@ -424,7 +429,17 @@ Knowledge Base 검색 결과:
         """맥락을 고려한 검색 실패 처리"""
         try:
             original_query = context.get("original_query", "")
-            
+
+            # 종료 직전 상태 fast path: 남은 반복이 1회 이하면 재시도 판단용
+            # Bedrock 호출을 생략하고 결정적 안내 답변을 반환
+            if context.get("iterations_remaining", self.config.max_iterations) <= 1:
+                return self._create_final_response(
+                    f"죄송합니다. Knowledge Base에서 '{original_query}'에 대한 관련 정보를 찾을 수 없었습니다.\n"
+                    f"사용한 검색 키워드: {', '.join(search_keywords) if search_keywords else '없음'}\n\n"
+                    "질문을 다른 표현으로 바꾸거나 더 구체적인 키워드로 다시 시도해 주세요.",
+                    "반복 한도 도달 직전으로 검색 실패 안내 직접 생성"
+                )
+
             # 검색 실패 시에도 일반적인 답변 제공
             prompt = f"""사용자 질문: {original_query}
 검색 키워드: {search_keywords}
@@ -457,13 +472,7 @@ Knowledge Base에서 관련 정보를 찾을 수 없었습니다.
     
     def _is_simple_greeting(self, query: str) -> bool:
         """간단한 인사말인지 확인"""
-        greetings = [
-            "안녕", "hello", "hi", "hey", "안녕하세요", "안녕하십니까",
-            "좋은 아침", "좋은 오후", "좋은 저녁", "반갑습니다"
-        ]
-        
-        query_lower = query.lower().strip()
-        return any(greeting in query_lower for greeting in greetings)
+        return bool(_GREETING_RE.search(query.lower().strip()))
     
     def _generate_greeting_response(self, query: str) -> str:
         """인사말에 대한 응답 생성"""
@@ -493,12 +502,11 @@ Knowledge Base에서 관련 정보를 찾을 수 없었습니다.
             }
         
         try:
-            # 검색 결과 요약 생성
-            results_summary = ""
-            for i, result in enumerate(search_results, 1):
-                content = result.get('content', '')[:200]  # 200자로 제한
-                score = result.get('score', 0)
-                results_summary += f"결과 {i} (관련성: {score:.3f}): {content}...\n"
+            # 검색 결과 요약 생성 (200자로 제한)
+            results_summary = "".join(
+                f"결과 {i} (관련성: {result.get('score', 0):.3f}): {result.get('content', '')[:200]}...\n"
+                for i, result in enumerate(search_results, 1)
+            )
             
             # LLM을 통한 품질 평가
             evaluation_prompt = f"""사용자 질문: {query}
@@ -530,7 +538,8 @@ REASON: [평가 이유를 한 문장으로]"""
                 prompt=evaluation_prompt,
                 temperature=0.1,  # 일관된 평가를 위해 낮은 temperature
                 max_tokens=200,
-                system_prompt="당신은 검색 결과의 품질을 객관적으로 평가하는 전문가입니다."
+                system_prompt="당신은 검색 결과의 품질을 객관적으로 평가하는 전문가입니다.",
+                cache_system_prompt=True
             )
             
             # 응답 파싱
@@ -608,7 +617,8 @@ KEYWORD4: [키워드4] (선택사항)"""
                 prompt=keyword_generation_prompt,
                 temperature=0.7,  # 창의적인 키워드 생성을 위해 높은 temperature
                 max_tokens=300,
-                system_prompt="당신은 검색 키워드 최적화 전문가입니다. 다양한 관점에서 효과적인 검색 키워드를 생성할 수 있습니다."
+                system_prompt="당신은 검색 키워드 최적화 전문가입니다. 다양한 관점에서 효과적인 검색 키워드를 생성할 수 있습니다.",
+                cache_system_prompt=True
             )
             
             # 키워드 추출
@@ -638,10 +648,8 @@ KEYWORD4: [키워드4] (선택사항)"""
     
     def _fallback_keyword_generation(self, query: str, previous_keywords: List[str]) -> List[str]:
         """폴백 키워드 생성 (LLM 실패 시)"""
-        import re
-        
         # 원본 쿼리에서 핵심 단어 추출
-        korean_words = re.findall(r'[가-힣]+', query)
+        korean_words = _KOREAN_WORD_RE.findall(query)
         new_keywords = []
         
         # 단어 조합 생성
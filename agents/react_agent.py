@@ -2,13 +2,17 @@
 지능적 ReAct Agent v5 - KB 설명 기반 동적 검색
 """
 
+import logging
 import time
+from collections import Counter
 from typing import Dict, List, Any
 from utils.config import AgentConfig
 from .orchestration import OptimizedOrchestrationAgent  # KB 우선순위 기반 초고속
 from .action import ActionAgent
 from .observation import ObservationAgent
 
+logger = logging.getLogger(__name__)
+
 
 class SafetyController:
     """ReAct 루프의 안전장치를 관리하는 클래스"""
@@ -16,7 +20,7 @@ class SafetyController:
     def __init__(self, max_iterations: int = 5):
         self.max_iterations = max_iterations
         self.used_keywords = set()
-        self.repeated_actions = []
+        self.repeated_actions = Counter()
         self.error_count = 0
         self.max_errors = 3
         
@@ -27,29 +31,35 @@ class SafetyController:
         if self.error_count >= self.max_errors:
             return False, f"연속 에러가 {self.max_errors}회 발생했습니다."
         
-        if action_result.get("search_keywords"):
-            keywords = set(action_result["search_keywords"])
-            if keywords and keywords.issubset(self.used_keywords) and len(keywords) > 2:
+        # 키워드는 한 번만 정렬해 부분집합 검사와 액션 시그니처가 공유
+        keywords = action_result.get("search_keywords")
+        sorted_keywords = tuple(sorted(keywords)) if keywords else ()
+        
+        if keywords:
+            # 임시 집합을 만들지 않고 첫 미사용 키워드에서 단락 평가
+            if len(keywords) > 2 and all(k in self.used_keywords for k in keywords):
                 return False, "동일한 검색 키워드가 반복되어 루프를 중단합니다."
             self.used_keywords.update(keywords)
         
-        action_signature = self._get_action_signature(action_result)
-        signature_count = self.repeated_actions.count(action_signature)
-        if signature_count >= 2:
+        action_signature = (action_result.get("type", "unknown"), sorted_keywords)
+        if self.repeated_actions[action_signature] >= 2:
             return False, "동일한 액션이 3회 반복되어 루프를 중단합니다."
-        
-        self.repeated_actions.append(action_signature)
+
+        self.repeated_actions[action_signature] += 1
         return True, ""
     
+    def reset(self):
+        """재실행 전 상태 초기화 (기존 해시 테이블 용량은 유지한 채 재사용)"""
+        self.used_keywords.clear()
+        self.repeated_actions.clear()
+        self.error_count = 0
+    
     def record_error(self):
         self.error_count += 1
     
     def reset_error_count(self):
         self.error_count = 0
     
-    def _get_action_signature(self, action_result: dict) -> str:
-        return f"{action_result.get('type', 'unknown')}_{hash(str(action_result.get('search_keywords', [])))}"
-
 
 class IntelligentReActAgent:
     """지능적 ReAct Agent v5 - KB 설명 기반 동적 검색"""
@@ -60,12 +70,28 @@ class IntelligentReActAgent:
         self.orchestration_agent = OptimizedOrchestrationAgent(config)
         self.action_agent = ActionAgent(config)
         self.observation_agent = ObservationAgent(config)
+        # 실행마다 reset()으로 재사용 (매 턴 재할당 방지)
+        self.safety_controller = SafetyController(max_iterations=config.max_iterations)
     
     def run(self, user_query: str, conversation_history: List[Dict]) -> Dict:
         """지능적 KB 검색이 적용된 ReAct 루프 실행"""
+        result = None
+        for event_type, payload in self.run_events(user_query, conversation_history):
+            if event_type == "result":
+                result = payload
+        return result
+
+    def run_events(self, user_query: str, conversation_history: List[Dict]):
+        """ReAct 루프를 이벤트 제너레이터로 실행
+
+        각 단계 시작 직전에 ("status", 진행 문구) 이벤트를 내보내고,
+        루프 종료 시 ("result", 결과 dict)를 내보낸다.
+        UI가 블로킹 대기 대신 단계별 진행 상황을 실시간 표시할 수 있다.
+        """
         start_time = time.time()
         
-        safety_controller = SafetyController(max_iterations=self.config.max_iterations)
+        safety_controller = self.safety_controller
+        safety_controller.reset()
         
         context = {
             "original_query": user_query,
@@ -78,33 +104,40 @@ class IntelligentReActAgent:
         steps = []
         final_answer = None
         termination_reason = "정상 완료"
+        orchestration_count = 0
         
         try:
             for iteration in range(self.config.max_iterations):
-                print(f"\n🔄 ReAct 반복 {iteration + 1}/{self.config.max_iterations}")
+                logger.info("🔄 ReAct 반복 %d/%d", iteration + 1, self.config.max_iterations)
+                # Observation이 종료 직전 상태를 인지할 수 있도록 남은 반복 수 전달
+                context["iterations_remaining"] = self.config.max_iterations - iteration
                 
                 # 1. Intelligent Orchestration
-                print("🧠 Intelligent Orchestration 단계...")
+                yield ("status", f"🧠 Orchestration: 쿼리 분석 중... ({iteration + 1}/{self.config.max_iterations})")
+                logger.info("🧠 Intelligent Orchestration 단계...")
                 orchestration_start = time.time()
                 
                 orchestration_result = self.orchestration_agent.orchestrate(context)
                 steps.append(orchestration_result)
+                # 하위 Agent가 역방향 스캔 없이 바로 참조할 수 있도록 기록
+                context["last_orchestration_step"] = orchestration_result
+                orchestration_count += 1
                 
                 orchestration_time = time.time() - orchestration_start
-                print(f"   완료 ({orchestration_time:.2f}초)")
+                logger.info("   완료 (%.2f초)", orchestration_time)
                 
                 # 지능적 판단 결과 표시
                 parsed_result = orchestration_result.get("parsed_result", {})
                 if parsed_result.get("context_applied", False):
-                    print("   🔗 대화 맥락 적용됨")
+                    logger.info("   🔗 대화 맥락 적용됨")
                 
                 kb_decision = parsed_result.get("kb_decision", {})
                 if kb_decision:
                     rule_applied = kb_decision.get("rule_applied", "")
                     reason = kb_decision.get("reason", "")
-                    print(f"   🎯 KB 검색 결정: {kb_decision.get('needs_search', False)}")
-                    print(f"   📋 적용 규칙: {rule_applied}")
-                    print(f"   💡 판단 이유: {reason}")
+                    logger.info("   🎯 KB 검색 결정: %s", kb_decision.get("needs_search", False))
+                    logger.info("   📋 적용 규칙: %s", rule_applied)
+                    logger.info("   💡 판단 이유: %s", reason)
                 
                 if parsed_result.get("error"):
                     safety_controller.record_error()
@@ -113,8 +146,29 @@ class IntelligentReActAgent:
                 
                 # KB 검색이 필요하지 않은 경우 바로 Observation으로
                 if not parsed_result.get("needs_kb_search", False):
-                    print("   ℹ️ KB 검색 불필요, Observation으로 이동")
-                    
+                    # Orchestration이 이미 최종 답변을 확정한 경우 (인사말 등)
+                    # Observation의 Bedrock 호출을 생략
+                    if parsed_result.get("final_answer"):
+                        logger.info("   ⚡ Orchestration에서 답변 확정, Observation 생략")
+                        final_answer = parsed_result["final_answer"]
+                        termination_reason = "Orchestration 직접 답변 완료"
+                        steps.append({
+                            "type": "Observation",
+                            "model": self.config.observation_model,
+                            "content": final_answer,
+                            "parsed_result": {
+                                "analysis": "Orchestration 단계에서 확정된 답변 사용",
+                                "is_final_answer": True,
+                                "final_answer": final_answer,
+                                "needs_retry": False,
+                                "retry_keywords": []
+                            },
+                            "error": False
+                        })
+                        break
+
+                    logger.info("   ℹ️ KB 검색 불필요, Observation으로 이동")
+
                     observation_result = self.observation_agent.observe(context, steps)
                     steps.append(observation_result)
                     
@@ -125,9 +179,12 @@ class IntelligentReActAgent:
                         break
                 
                 # 2. Intelligent Action (KB 검색)
-                print("⚡ Intelligent Action 단계...")
+                yield ("status", "⚡ Action: Knowledge Base 검색 중...")
+                logger.info("⚡ Intelligent Action 단계...")
                 action_result = self.action_agent.act(context, steps)
                 steps.append(action_result)
+                context["last_action_step"] = action_result
+                context["action_count"] = context.get("action_count", 0) + 1
                 
                 action_parsed = action_result.get("parsed_result", {})
                 if action_parsed.get("error"):
@@ -136,9 +193,8 @@ class IntelligentReActAgent:
                     safety_controller.reset_error_count()
                 
                 # 3. Context-Aware Observation
-                print("👁️ Context-Aware Observation 단계...")
-                # previous_steps를 context에 추가하여 반복 횟수 추적
-                context["previous_steps"] = steps
+                yield ("status", "👁️ Observation: 결과 평가 및 답변 생성 중...")
+                logger.info("👁️ Context-Aware Observation 단계...")
                 observation_result = self.observation_agent.observe(context, steps)
                 steps.append(observation_result)
                 
@@ -154,7 +210,7 @@ class IntelligentReActAgent:
                 if obs_parsed.get("needs_retry", False):
                     retry_keywords = obs_parsed.get("retry_keywords", [])
                     if retry_keywords:
-                        print(f"   🔄 재시도 필요: {retry_keywords}")
+                        logger.info("   🔄 재시도 필요: %s", retry_keywords)
                         # 다음 반복에서 사용할 키워드를 context에 추가
                         context["retry_keywords"] = retry_keywords
                         context["retry_reason"] = obs_parsed.get("retry_reason", "검색 결과 불충분")
@@ -180,11 +236,11 @@ class IntelligentReActAgent:
         
         total_time = time.time() - start_time
         
-        return {
+        yield ("result", {
             "final_answer": final_answer,
             "steps": steps,
             "metadata": {
-                "total_iterations": len([s for s in steps if s.get("type") == "Orchestration"]),
+                "total_iterations": orchestration_count,
                 "total_time": total_time,
                 "termination_reason": termination_reason,
                 "orchestration_model": self.orchestration_agent.get_model_name(),
@@ -195,7 +251,7 @@ class IntelligentReActAgent:
                 "kb_enhanced": True,
                 "intelligent_kb_search": True
             }
-        }
+        })
     
     def get_performance_info(self) -> Dict:
         return {
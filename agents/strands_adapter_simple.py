@@ -4,10 +4,28 @@ Mock 환경에서도 작동하는 간소화된 버전
 """
 
 import asyncio
+import logging
+import os
+import re
+import threading
 from typing import Dict, List, Any, Optional
 from utils.config import AgentConfig
 from .strands_react_simple import SimpleStrandsReActChatbot
 
+logger = logging.getLogger(__name__)
+
+# uvloop이 설치된 경우 선택적으로 사용 (CHATBOT_USE_UVLOOP=1 설정 시)
+if os.environ.get("CHATBOT_USE_UVLOOP") == "1":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("✅ uvloop 이벤트 루프 정책 적용")
+    except ImportError:
+        logger.warning("⚠️ uvloop 미설치, 기본 이벤트 루프 사용")
+
+# 인사말 판별 패턴 (모듈 로드 시 1회 컴파일)
+_GREETING_RE = re.compile(r"안녕|hello|hi", re.IGNORECASE)
+
 
 class SimpleStrandsCompatibilityAdapter:
     """
@@ -23,14 +41,23 @@ class SimpleStrandsCompatibilityAdapter:
         self.config = config
         self.use_strands = use_strands
         
+        # 비동기 처리용 전용 이벤트 루프 (요청마다 새 루프를 만들지 않도록 1회 생성)
+        self._loop = None
+
         # Strands 시스템 초기화
         if use_strands:
             try:
                 self.strands_chatbot = SimpleStrandsReActChatbot(config)
                 self.strands_available = True
-                print("✅ Simple Strands Agents 초기화 성공")
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="strands-adapter-loop",
+                    daemon=True
+                ).start()
+                logger.info("✅ Simple Strands Agents 초기화 성공")
             except Exception as e:
-                print(f"⚠️ Simple Strands Agents 초기화 실패: {e}")
+                logger.warning("⚠️ Simple Strands Agents 초기화 실패: %s", e)
                 self.strands_available = False
         else:
             self.strands_available = False
@@ -55,94 +82,98 @@ class SimpleStrandsCompatibilityAdapter:
         # Strands 시스템 시도
         if self.strands_available and self.use_strands:
             try:
-                print("🚀 Simple Strands Agents 처리 시작")
-                
-                # 비동기 처리를 동기로 변환
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                try:
-                    strands_result = loop.run_until_complete(
-                        self.strands_chatbot.process_query(query, conversation_history)
-                    )
-                    
-                    if not strands_result.get("error"):
-                        print("✅ Simple Strands Agents 처리 완료")
-                        return self._convert_strands_result(strands_result)
-                    else:
-                        print(f"❌ Simple Strands Agents 오류: {strands_result.get('content')}")
-                        raise Exception(strands_result.get("content", "Unknown error"))
-                        
-                finally:
-                    loop.close()
-                    
+                logger.info("🚀 Simple Strands Agents 처리 시작")
+
+                # 비동기 처리를 동기로 변환 (상주 루프에 코루틴 제출)
+                future = asyncio.run_coroutine_threadsafe(
+                    self.strands_chatbot.process_query(query, conversation_history),
+                    self._loop
+                )
+                strands_result = future.result(timeout=120)
+
+                if not strands_result.get("error"):
+                    logger.info("✅ Simple Strands Agents 처리 완료")
+                    return self._convert_strands_result(strands_result)
+                else:
+                    logger.warning("❌ Simple Strands Agents 오류: %s", strands_result.get("content"))
+                    raise Exception(strands_result.get("content", "Unknown error"))
+
             except Exception as e:
-                print(f"⚠️ Simple Strands Agents 실패, 폴백 처리: {e}")
+                logger.warning("⚠️ Simple Strands Agents 실패, 폴백 처리: %s", e)
                 return self._fallback_response(query, conversation_history, str(e))
         
         # 폴백 처리
         else:
-            print("🔄 폴백 시스템 사용")
+            logger.info("🔄 폴백 시스템 사용")
             return self._fallback_response(query, conversation_history, "Strands 시스템 비활성화")
     
     def _convert_strands_result(self, strands_result: Dict) -> Dict:
         """Strands 결과를 기존 형식으로 변환"""
+        # 반복 조회되는 값들을 로컬로 한 번만 추출
+        content = strands_result.get("content", "")
+        search_results = strands_result.get("search_results", [])
+        processing_time = strands_result.get("processing_time", 0)
+        iterations = strands_result.get("iterations", 1)
+        context_analysis = strands_result.get("context_analysis", {})
+        framework = strands_result.get("framework", "Simple Strands Agents")
+
         return {
             "type": "ReAct",
-            "content": strands_result.get("content", ""),
-            "final_answer": strands_result.get("content", ""),
-            "search_results": strands_result.get("search_results", []),
-            "processing_time": strands_result.get("processing_time", 0),
-            "iterations": strands_result.get("iterations", 1),
-            "context_analysis": strands_result.get("context_analysis", {}),
+            "content": content,
+            "final_answer": content,
+            "search_results": search_results,
+            "processing_time": processing_time,
+            "iterations": iterations,
+            "context_analysis": context_analysis,
             "model_info": {
-                "framework": strands_result.get("framework", "Simple Strands Agents"),
+                "framework": framework,
                 "strands_available": strands_result.get("strands_available", False)
             },
             "error": False,
-            "steps": self._generate_steps_summary(strands_result)
+            "steps": self._generate_steps_summary(
+                context_analysis, search_results, iterations, processing_time, framework
+            )
         }
-    
-    def _generate_steps_summary(self, strands_result: Dict) -> List[Dict]:
+
+    def _generate_steps_summary(self, context_analysis: Dict, search_results: List[Dict],
+                                iterations: int, processing_time: float, framework: str) -> List[Dict]:
         """단계별 요약 생성"""
         steps = []
-        
+
         # 맥락 분석 단계
-        context_analysis = strands_result.get("context_analysis", {})
         steps.append({
             "type": "Context Analysis",
             "content": "대화 맥락 분석 완료",
             "details": context_analysis
         })
-        
+
         # 검색 단계 (있는 경우)
-        search_results = strands_result.get("search_results", [])
         if search_results:
             steps.append({
                 "type": "Knowledge Base Search",
                 "content": f"KB 검색 완료: {len(search_results)}개 결과",
                 "details": {
                     "results_count": len(search_results),
-                    "iterations": strands_result.get("iterations", 1)
+                    "iterations": iterations
                 }
             })
-        
+
         # 답변 생성 단계
         steps.append({
             "type": "Answer Generation",
             "content": "최종 답변 생성 완료",
             "details": {
-                "processing_time": strands_result.get("processing_time", 0),
-                "framework": strands_result.get("framework", "Simple Strands Agents")
+                "processing_time": processing_time,
+                "framework": framework
             }
         })
-        
+
         return steps
     
     def _fallback_response(self, query: str, history: List[Dict], reason: str) -> Dict:
         """폴백 응답 생성"""
         # 간단한 규칙 기반 응답
-        if any(word in query.lower() for word in ["안녕", "hello", "hi"]):
+        if _GREETING_RE.search(query):
             answer = "안녕하세요! 무엇을 도와드릴까요?"
         elif "테스트" in query:
             answer = "테스트 응답입니다. 시스템이 정상적으로 작동하고 있습니다."
@@ -206,6 +237,11 @@ class SimpleStrandsCompatibilityAdapter:
             "kb_id": self.config.kb_id if self.config.is_kb_enabled() else None
         }
     
+    def aclose(self):
+        """전용 이벤트 루프 종료"""
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
     def switch_system(self, use_strands: bool) -> bool:
         """시스템 전환"""
         if use_strands and not self.strands_available:
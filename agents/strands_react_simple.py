@@ -4,6 +4,7 @@ Mock 환경에서도 작동하는 간소화된 버전
 """
 
 import json
+import re
 import time
 from typing import Dict, List, Any, Optional
 
@@ -17,6 +18,14 @@ except ImportError:
 
 from utils.config import AgentConfig
 from .strands_tools_simple import SimpleStrandsToolsManager
+from .timeout_wrapper import timed
+
+# 맥락 분석용 패턴 (모듈 로드 시 1회 컴파일)
+_GREETING_RE = re.compile(r"안녕|hello|hi")
+_CONTINUATION_RE = re.compile(r"다음|그럼|계속|또는")
+
+# Mock 검색 결과용 고정 출처 표기
+_MOCK_KB_SOURCE = "Mock KB"
 
 
 class SimpleStrandsReActChatbot:
@@ -73,58 +82,55 @@ class SimpleStrandsReActChatbot:
         Returns:
             처리 결과
         """
-        start_time = time.time()
-        
-        try:
-            if conversation_history is None:
-                conversation_history = []
-            
-            print(f"🔍 쿼리 처리 시작: {query}")
-            
-            # 1단계: 대화 맥락 분석
-            context_analysis = await self._analyze_context(query, conversation_history)
-            print(f"   맥락 분석: {context_analysis}")
-            
-            # 2단계: 처리 방법 결정
-            if context_analysis.get("is_greeting"):
-                result = await self._handle_greeting(query)
-            elif context_analysis.get("is_continuation"):
-                result = await self._handle_continuation(query, conversation_history)
-            elif not self.config.is_kb_enabled():
-                result = await self._handle_direct_answer(query)
-            else:
-                result = await self._handle_kb_search(query, conversation_history)
-            
-            # 처리 시간 계산
-            processing_time = time.time() - start_time
-            
-            return {
-                "type": "SimpleStrandsReAct",
-                "content": result.get("answer", "답변을 생성할 수 없습니다."),
-                "processing_time": processing_time,
-                "context_analysis": context_analysis,
-                "search_results": result.get("search_results", []),
-                "iterations": result.get("iterations", 1),
-                "framework": "Simple Strands Agents",
-                "strands_available": self.strands_available,
-                "error": False
-            }
-            
-        except Exception as e:
-            return {
-                "type": "SimpleStrandsReAct",
-                "content": f"처리 중 오류가 발생했습니다: {str(e)}",
-                "processing_time": time.time() - start_time,
-                "error": True,
-                "error_details": str(e)
-            }
+        with timed() as elapsed:
+            try:
+                if conversation_history is None:
+                    conversation_history = []
+                
+                print(f"🔍 쿼리 처리 시작: {query}")
+                
+                # 1단계: 대화 맥락 분석
+                context_analysis = await self._analyze_context(query, conversation_history)
+                print(f"   맥락 분석: {context_analysis}")
+                
+                # 2단계: 처리 방법 결정
+                if context_analysis.get("is_greeting"):
+                    result = await self._handle_greeting(query)
+                elif context_analysis.get("is_continuation"):
+                    result = await self._handle_continuation(query, conversation_history)
+                elif not self.config.is_kb_enabled():
+                    result = await self._handle_direct_answer(query)
+                else:
+                    result = await self._handle_kb_search(query, conversation_history)
+                
+                return {
+                    "type": "SimpleStrandsReAct",
+                    "content": result.get("answer", "답변을 생성할 수 없습니다."),
+                    "processing_time": elapsed(),
+                    "context_analysis": context_analysis,
+                    "search_results": result.get("search_results", []),
+                    "iterations": result.get("iterations", 1),
+                    "framework": "Simple Strands Agents",
+                    "strands_available": self.strands_available,
+                    "error": False
+                }
+                
+            except Exception as e:
+                return {
+                    "type": "SimpleStrandsReAct",
+                    "content": f"처리 중 오류가 발생했습니다: {str(e)}",
+                    "processing_time": elapsed(),
+                    "error": True,
+                    "error_details": str(e)
+                }
     
     async def _analyze_context(self, query: str, history: List[Dict]) -> Dict:
         """대화 맥락 분석"""
         try:
             # 간단한 맥락 분석 (Mock 환경에서도 작동)
-            is_greeting = any(word in query.lower() for word in ["안녕", "hello", "hi"])
-            is_continuation = any(word in query.lower() for word in ["다음", "그럼", "계속", "또는"])
+            query_lower = query.lower()
+            is_greeting = _GREETING_RE.search(query_lower) is not None
+            is_continuation = _CONTINUATION_RE.search(query_lower) is not None
             
             return {
                 "is_greeting": is_greeting,
@@ -227,19 +233,22 @@ kb_search_tool을 사용하여 검색하고 결과를 바탕으로 답변하세
             
             response = self.main_agent(search_prompt)
             
-            # Mock 검색 결과
-            mock_results = [
-                {
-                    "id": 1,
-                    "content": f"{query}에 대한 Mock 검색 결과입니다.",
-                    "source": "Mock KB",
-                    "score": 0.8
-                }
-            ]
+            # Mock 환경에서만 합성 검색 결과 생성 (실제 환경은 에이전트가 도구로 검색)
+            if self.strands_available:
+                search_results = []
+            else:
+                search_results = [
+                    {
+                        "id": 1,
+                        "content": f"{query}에 대한 Mock 검색 결과입니다.",
+                        "source": _MOCK_KB_SOURCE,
+                        "score": 0.8
+                    }
+                ]
             
             return {
                 "answer": str(response),
-                "search_results": mock_results,
+                "search_results": search_results,
                 "iterations": 1
             }
             
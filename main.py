@@ -10,70 +10,83 @@ import os
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# 강화된 타임아웃 설정을 가장 먼저 적용
-print("🔧 강화된 타임아웃 설정 적용 중...")
-
-# 1. 환경변수 기반 타임아웃 설정 (더 짧게)
-os.environ['AWS_DEFAULT_READ_TIMEOUT'] = '60'      # 60초로 단축
-os.environ['AWS_DEFAULT_CONNECT_TIMEOUT'] = '30'   # 30초로 단축
-os.environ['AWS_MAX_ATTEMPTS'] = '2'               # 재시도 횟수 감소
-os.environ['AWS_RETRY_MODE'] = 'standard'          # 표준 모드
-
-# 2. urllib3 타임아웃 패치 (더 짧게)
-try:
-    import urllib3
-    from urllib3.util.timeout import Timeout
-    urllib3.util.timeout.DEFAULT_TIMEOUT = Timeout(connect=30.0, read=60.0)
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    print("✅ urllib3 타임아웃 패치 완료 (연결: 30초, 읽기: 60초)")
-except Exception as e:
-    print(f"⚠️ urllib3 패치 실패: {e}")
-
-# 3. boto3 기본 설정 패치 (더 짧게)
-try:
-    import boto3
-    from botocore.config import Config
-    
-    default_config = Config(
-        read_timeout=60,      # 60초로 단축
-        connect_timeout=30,   # 30초로 단축
-        retries={'max_attempts': 2, 'mode': 'standard'},  # 재시도 감소
-        max_pool_connections=5
-    )
-    
-    print("✅ boto3 타임아웃 설정 완료 (연결: 30초, 읽기: 60초)")
-except Exception as e:
-    print(f"⚠️ boto3 설정 실패: {e}")
-
-# 4. 시스템 소켓 타임아웃
-try:
-    import socket
-    socket.setdefaulttimeout(60)  # 60초
-    print("✅ 시스템 소켓 타임아웃 설정 완료 (60초)")
-except Exception as e:
-    print(f"⚠️ 소켓 타임아웃 설정 실패: {e}")
-
-# 5. requests 세션 패치
-try:
-    import requests
-    from requests.adapters import HTTPAdapter
-    from urllib3.util.retry import Retry
-    
-    retry_strategy = Retry(
-        total=1,  # 1회만 재시도
-        backoff_factor=0.5,
-        status_forcelist=[429, 500, 502, 503, 504],
-    )
-    
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session = requests.Session()
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    session.timeout = (20, 45)  # (연결, 읽기) 타임아웃
+
+@st.cache_resource
+def _apply_network_patches() -> bool:
+    """강화된 타임아웃 설정 적용 (프로세스당 1회)
+
+    Streamlit은 상호작용마다 이 스크립트를 재실행하므로,
+    cache_resource로 감싸 환경변수/소켓/세션 패치가 rerun마다 반복되지 않게 한다.
+    """
+    print("🔧 강화된 타임아웃 설정 적용 중...")
+    
+    # 1. 환경변수 기반 타임아웃 설정 (더 짧게)
+    os.environ['AWS_DEFAULT_READ_TIMEOUT'] = '60'      # 60초로 단축
+    os.environ['AWS_DEFAULT_CONNECT_TIMEOUT'] = '30'   # 30초로 단축
+    os.environ['AWS_MAX_ATTEMPTS'] = '2'               # 재시도 횟수 감소
+    os.environ['AWS_RETRY_MODE'] = 'standard'          # 표준 모드
+    
+    # 2. urllib3 타임아웃 패치 (더 짧게)
+    try:
+        import urllib3
+        from urllib3.util.timeout import Timeout
+        urllib3.util.timeout.DEFAULT_TIMEOUT = Timeout(connect=30.0, read=60.0)
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        print("✅ urllib3 타임아웃 패치 완료 (연결: 30초, 읽기: 60초)")
+    except Exception as e:
+        print(f"⚠️ urllib3 패치 실패: {e}")
+    
+    # 3. boto3 기본 설정 패치 (더 짧게)
+    try:
+        import boto3
+        from botocore.config import Config
+        
+        default_config = Config(
+            read_timeout=60,      # 60초로 단축
+            connect_timeout=30,   # 30초로 단축
+            retries={'max_attempts': 2, 'mode': 'standard'},  # 재시도 감소
+            max_pool_connections=5
+        )
+        
+        print("✅ boto3 타임아웃 설정 완료 (연결: 30초, 읽기: 60초)")
+    except Exception as e:
+        print(f"⚠️ boto3 설정 실패: {e}")
+    
+    # 4. 시스템 소켓 타임아웃
+    try:
+        import socket
+        socket.setdefaulttimeout(60)  # 60초
+        print("✅ 시스템 소켓 타임아웃 설정 완료 (60초)")
+    except Exception as e:
+        print(f"⚠️ 소켓 타임아웃 설정 실패: {e}")
+    
+    # 5. requests 세션 패치
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        retry_strategy = Retry(
+            total=1,  # 1회만 재시도
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        
+        adapter = HTTPAdapter(max_retries=retry_strategy)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.timeout = (20, 45)  # (연결, 읽기) 타임아웃
+        
+        print("✅ requests 세션 패치 완료 (연결: 20초, 읽기: 45초)")
+    except Exception as e:
+        print(f"⚠️ requests 패치 실패: {e}")
     
-    print("✅ requests 세션 패치 완료 (연결: 20초, 읽기: 45초)")
-except Exception as e:
-    print(f"⚠️ requests 패치 실패: {e}")
+    return True
+
+
+# 강화된 타임아웃 설정을 가장 먼저 적용 (첫 실행에서만 실제로 수행됨)
+_apply_network_patches()
 
 from ui.sidebar import render_sidebar
 from ui.chat import render_chat_interface
@@ -5,9 +5,81 @@ KB 설명 입력이 추가된 Streamlit 사이드바 UI 컴포넌트
 import streamlit as st
 from typing import Dict, Any
 
-from utils.config import AVAILABLE_MODELS, MODEL_CHARACTERISTICS, AgentConfig
-from utils.bedrock_client import BedrockClient
-from utils.kb_search import KnowledgeBaseSearcher
+from utils.config import (
+    AVAILABLE_MODELS,
+    MODEL_CHARACTERISTICS,
+    MODEL_ID_TO_NAME,
+    MODEL_IS_NOVA,
+    MODEL_MAX_TOKENS,
+    AgentConfig,
+)
+
+# 모델 선택 UI용 목록 (매 리런마다 재구성하지 않도록 모듈 로드 시 1회 구성)
+# Claude 모델만 (복잡한 추론 필요한 단계용)
+CLAUDE_MODEL_NAMES = (
+    "Claude Sonnet 4",
+    "Claude 3.7 Sonnet",
+    "Claude 3.5 Sonnet v2",
+    "Claude 3.5 Haiku",
+)
+CLAUDE_MODEL_IDS = tuple(AVAILABLE_MODELS[name] for name in CLAUDE_MODEL_NAMES)
+
+# 모든 모델 (Action 단계용)
+ALL_MODEL_NAMES = tuple(AVAILABLE_MODELS.keys())
+ALL_MODEL_IDS = tuple(AVAILABLE_MODELS.values())
+
+# 권장 조합 표시용 라벨 (AgentConfig.get_model_recommendations의 키와 대응)
+_PRESET_LABELS = {
+    "high_performance": "🚀 고성능 조합",
+    "balanced": "⚖️ 균형 조합",
+    "cost_effective": "💰 경제적 조합 (기본)",
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _get_bedrock_client():
+    """연결 테스트용 BedrockClient 재사용 (클릭마다 재생성 방지)
+
+    boto3를 끌어오는 import는 버튼을 실제로 누를 때까지 지연한다.
+    """
+    from utils.bedrock_client import BedrockClient
+    return BedrockClient()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_kb_searcher():
+    """연결 테스트용 KnowledgeBaseSearcher 재사용 (import 지연 포함)"""
+    from utils.kb_search import KnowledgeBaseSearcher
+    return KnowledgeBaseSearcher()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _probe_kb(kb_id: str) -> int:
+    """KB 연결 프로브 (5분 TTL 캐시) — 테스트 검색 결과 수 반환"""
+    results = _get_kb_searcher().search(
+        kb_id=kb_id,
+        query="테스트",
+        max_results=1
+    )
+    return len(results)
+
+
+@st.cache_resource(show_spinner=False)
+def _probe_strands_status():
+    """Strands 프레임워크 가용성 확인 (프로세스당 1회만 어댑터 생성)
+
+    Returns:
+        (available, error) 튜플 — error는 확인 실패 시 메시지, 성공 시 빈 문자열
+    """
+    try:
+        from agents.strands_adapter import StrandsCompatibilityAdapter
+        
+        # 기본 설정으로 상태 확인
+        temp_config = AgentConfig.create_default()
+        adapter = StrandsCompatibilityAdapter(temp_config, use_strands=True)
+        return adapter.strands_available, ""
+    except Exception as e:
+        return False, str(e)
 
 
 def _render_system_status():
@@ -21,24 +93,22 @@ def _render_system_status():
         st.sidebar.success("✅ Strands Agents 활성")
         st.sidebar.caption("AWS 공식 프레임워크 사용 중")
         
-        # Strands 시스템 상태 확인
-        try:
-            from agents.strands_adapter import StrandsCompatibilityAdapter
-            from utils.config import AgentConfig
-            
-            # 기본 설정으로 상태 확인
-            temp_config = AgentConfig.create_default()
-            adapter = StrandsCompatibilityAdapter(temp_config, use_strands=True)
-            
-            if adapter.strands_available:
-                st.sidebar.info("🔧 Strands 프레임워크 준비됨")
-            else:
-                st.sidebar.warning("⚠️ Strands 초기화 실패")
-                st.sidebar.caption("Legacy 시스템으로 폴백됩니다")
-                
-        except Exception as e:
+        # Strands 시스템 상태 확인 (캐시된 프로브 결과 사용)
+        available, probe_error = _probe_strands_status()
+        
+        if probe_error:
             st.sidebar.error("❌ Strands 상태 확인 실패")
-            st.sidebar.caption(f"오류: {str(e)[:50]}...")
+            st.sidebar.caption(f"오류: {probe_error[:50]}...")
+        elif available:
+            st.sidebar.info("🔧 Strands 프레임워크 준비됨")
+        else:
+            st.sidebar.warning("⚠️ Strands 초기화 실패")
+            st.sidebar.caption("Legacy 시스템으로 폴백됩니다")
+        
+        # 수동 무효화: 환경이 바뀐 경우 재확인
+        if st.sidebar.button("🔄 상태 재확인", key="refresh_strands_status"):
+            _probe_strands_status.clear()
+            st.rerun()
     else:
         st.sidebar.info("🔄 Legacy ReAct 활성")
         st.sidebar.caption("기존 수동 ReAct 패턴 사용 중")
@@ -49,6 +119,8 @@ def _render_system_status():
     with col1:
         if st.button("🚀 Strands", disabled=use_strands, key="switch_to_strands"):
             st.session_state.use_strands = True
+            # Strands로 전환하는 시점에는 프로브를 새로 수행
+            _probe_strands_status.clear()
             st.rerun()
     
     with col2:
@@ -60,11 +132,8 @@ def _render_system_status():
 
 
 def _get_model_name(model_id: str) -> str:
-    """모델 ID에서 표시명 추출"""
-    for name, id in AVAILABLE_MODELS.items():
-        if id == model_id:
-            return name
-    return model_id.split(':')[0]  # 축약된 형태로 표시
+    """모델 ID에서 표시명 추출 (역방향 매핑 단일 조회)"""
+    return MODEL_ID_TO_NAME.get(model_id) or model_id.split(':')[0]  # 축약된 형태로 표시
 
 
 def render_sidebar() -> AgentConfig:
@@ -97,58 +166,50 @@ def render_sidebar() -> AgentConfig:
     # 대화 리셋 버튼
     _render_reset_button()
     
+    # 설정은 한 번만 구성해 요약 표시와 반환값이 공유
+    config = AgentConfig.from_streamlit_session()
+    
     # 설정 요약 표시
-    _render_config_summary()
+    _render_config_summary(config)
     
-    return AgentConfig.from_streamlit_session()
+    return config
 
 
 def _render_model_selection():
     """모델 선택 UI"""
     st.sidebar.header("🧠 Model Configuration")
     
-    # Claude 모델만 (복잡한 추론 필요한 단계용)
-    claude_models = [
-        "Claude Sonnet 4",
-        "Claude 3.7 Sonnet", 
-        "Claude 3.5 Sonnet v2",
-        "Claude 3.5 Haiku"
-    ]
-    claude_model_ids = [AVAILABLE_MODELS[name] for name in claude_models]
-    
-    # 모든 모델 (Action 단계용)
-    all_model_names = list(AVAILABLE_MODELS.keys())
-    all_model_ids = list(AVAILABLE_MODELS.values())
+    # 프리셋 버튼이 세션 상태를 바꾼 경우 선택 위치에 반영
+    current_orchestration = st.session_state.get('orchestration_model')
+    current_action = st.session_state.get('action_model')
+    current_observation = st.session_state.get('observation_model')
     
-    # Orchestration 모델 (Claude만)
-    orchestration_idx = st.sidebar.selectbox(
+    # Orchestration 모델 (Claude만) — 이름 튜플을 옵션으로 직접 사용 (format_func 람다 불필요)
+    orchestration_name = st.sidebar.selectbox(
         "🎯 Orchestration Model",
-        range(len(claude_models)),
-        format_func=lambda x: claude_models[x],
-        index=3,  # Claude 3.5 Haiku 기본값
+        CLAUDE_MODEL_NAMES,
+        index=CLAUDE_MODEL_IDS.index(current_orchestration) if current_orchestration in CLAUDE_MODEL_IDS else 3,  # Claude 3.5 Haiku 기본값
         help="쿼리 분석 및 실행 계획 수립 (Claude 모델 권장)"
     )
-    st.session_state['orchestration_model'] = claude_model_ids[orchestration_idx]
+    st.session_state['orchestration_model'] = AVAILABLE_MODELS[orchestration_name]
     
     # Action 모델 (모든 모델)
-    action_idx = st.sidebar.selectbox(
+    action_name = st.sidebar.selectbox(
         "⚡ Action Model", 
-        range(len(all_model_names)),
-        format_func=lambda x: all_model_names[x],
-        index=5,  # Nova Micro 기본값 (경제적)
+        ALL_MODEL_NAMES,
+        index=ALL_MODEL_IDS.index(current_action) if current_action in ALL_MODEL_IDS else 5,  # Nova Micro 기본값 (경제적)
         help="실제 액션(KB 검색 등) 수행 (모든 모델 사용 가능)"
     )
-    st.session_state['action_model'] = all_model_ids[action_idx]
+    st.session_state['action_model'] = AVAILABLE_MODELS[action_name]
     
     # Observation 모델 (Claude만)
-    observation_idx = st.sidebar.selectbox(
+    observation_name = st.sidebar.selectbox(
         "👁️ Observation Model",
-        range(len(claude_models)),
-        format_func=lambda x: claude_models[x], 
-        index=3,  # Claude 3.5 Haiku 기본값
+        CLAUDE_MODEL_NAMES,
+        index=CLAUDE_MODEL_IDS.index(current_observation) if current_observation in CLAUDE_MODEL_IDS else 3,  # Claude 3.5 Haiku 기본값
         help="결과 분석 및 최종 답변 생성 (Claude 모델 권장)"
     )
-    st.session_state['observation_model'] = claude_model_ids[observation_idx]
+    st.session_state['observation_model'] = AVAILABLE_MODELS[observation_name]
     
     # 권장 조합 표시
     _render_model_recommendations()
@@ -227,9 +288,12 @@ def _render_parameters():
         st.session_state.get('observation_model', '')
     ]
     
-    # 선택된 모델 중 하나라도 Nova가 있으면 5K 제한
-    has_nova = any('nova' in model.lower() for model in selected_models)
-    max_limit = 5000 if has_nova else 8000
+    # 선택된 모델 중 하나라도 Nova가 있으면 5K 제한 (사전 계산 테이블 조회)
+    has_nova = any(MODEL_IS_NOVA.get(model, False) for model in selected_models)
+    max_limit = min(
+        (MODEL_MAX_TOKENS[model] for model in selected_models if model in MODEL_MAX_TOKENS),
+        default=8000
+    )
     
     max_tokens = st.sidebar.slider(
         f"Max Tokens ({'Nova 제한: 5K' if has_nova else 'Claude 제한: 8K'})",
@@ -252,7 +316,7 @@ def _render_connection_tests():
         if st.button("Bedrock 테스트", help="Amazon Bedrock 연결 테스트"):
             with st.spinner("Bedrock 연결 테스트 중..."):
                 try:
-                    client = BedrockClient()
+                    client = _get_bedrock_client()
                     if client.test_connection():
                         st.success("✅ Bedrock 연결 성공!")
                     else:
@@ -266,14 +330,9 @@ def _render_connection_tests():
             if st.button("KB 테스트", help="Knowledge Base 연결 테스트"):
                 with st.spinner("KB 연결 테스트 중..."):
                     try:
-                        searcher = KnowledgeBaseSearcher()
-                        test_results = searcher.search(
-                            kb_id=kb_id,
-                            query="테스트",
-                            max_results=1
-                        )
-                        if test_results:
-                            st.success(f"✅ KB 연결 성공! ({len(test_results)}개 결과)")
+                        result_count = _probe_kb(kb_id)
+                        if result_count:
+                            st.success(f"✅ KB 연결 성공! ({result_count}개 결과)")
                         else:
                             st.warning("⚠️ KB 연결됨, 테스트 결과 없음")
                     except Exception as e:
@@ -283,22 +342,21 @@ def _render_connection_tests():
 
 
 def _render_model_recommendations():
-    """권장 모델 조합 표시"""
+    """권장 모델 조합 표시 및 적용 (utils/config.py의 프리셋 정의를 단일 출처로 사용)"""
     with st.sidebar.expander("💡 권장 모델 조합", expanded=False):
-        st.write("**🚀 고성능 조합**")
-        st.write("• Orchestration: Claude Sonnet 4")
-        st.write("• Action: Claude 3.7 Sonnet")
-        st.write("• Observation: Claude 3.5 Sonnet v2")
-        
-        st.write("**⚖️ 균형 조합**")
-        st.write("• Orchestration: Claude 3.5 Haiku")
-        st.write("• Action: Nova Lite")
-        st.write("• Observation: Claude 3.5 Haiku")
-        
-        st.write("**💰 경제적 조합 (기본)**")
-        st.write("• Orchestration: Claude 3.5 Haiku")
-        st.write("• Action: Nova Micro")
-        st.write("• Observation: Claude 3.5 Haiku")
+        for key, preset in AgentConfig.get_model_recommendations().items():
+            st.write(f"**{_PRESET_LABELS.get(key, key)}**")
+            st.write(f"• Orchestration: {_get_model_name(preset['orchestration'])}")
+            st.write(f"• Action: {_get_model_name(preset['action'])}")
+            st.write(f"• Observation: {_get_model_name(preset['observation'])}")
+            st.caption(preset["description"])
+            if st.button("적용", key=f"apply_preset_{key}"):
+                st.session_state.update({
+                    'orchestration_model': preset['orchestration'],
+                    'action_model': preset['action'],
+                    'observation_model': preset['observation'],
+                })
+                st.rerun()
 
 
 def _render_reset_button():
@@ -306,38 +364,37 @@ def _render_reset_button():
     st.sidebar.header("🔄 Reset")
     
     if st.sidebar.button("대화 기록 초기화", help="모든 대화 기록을 삭제합니다"):
-        if 'messages' in st.session_state:
-            st.session_state.messages = []
-        st.success("✅ 대화 기록이 초기화되었습니다!")
+        # 리스트를 새로 만들지 않고 제자리에서 비움 (키 등록 상태 유지)
+        st.session_state.setdefault('messages', []).clear()
+        st.session_state.setdefault('formatted_history', []).clear()
+        st.toast("✅ 대화 기록이 초기화되었습니다!")
         st.rerun()
 
 
-def _render_config_summary():
-    """설정 요약 표시"""
+def _render_config_summary(config: AgentConfig):
+    """설정 요약 표시 (세션 상태 대신 구성된 config 사용)"""
     with st.sidebar.expander("📋 현재 설정 요약", expanded=False):
         # 모델 정보
         st.write("**🧠 선택된 모델:**")
-        st.write(f"• Orchestration: {_get_model_name(st.session_state.get('orchestration_model', ''))}")
-        st.write(f"• Action: {_get_model_name(st.session_state.get('action_model', ''))}")
-        st.write(f"• Observation: {_get_model_name(st.session_state.get('observation_model', ''))}")
+        st.write(f"• Orchestration: {_get_model_name(config.orchestration_model)}")
+        st.write(f"• Action: {_get_model_name(config.action_model)}")
+        st.write(f"• Observation: {_get_model_name(config.observation_model)}")
         
         # KB 정보
-        kb_id = st.session_state.get('kb_id', '')
         st.write("**🔍 Knowledge Base:**")
-        if kb_id:
-            st.write(f"• ID: {kb_id}")
+        if config.is_kb_enabled():
+            st.write(f"• ID: {config.kb_id}")
         else:
             st.write("• 비활성화")
         
         # 파라미터 정보
         st.write("**⚙️ 파라미터:**")
-        st.write(f"• Temperature: {st.session_state.get('temperature', 0.1)}")
-        st.write(f"• Max Tokens: {st.session_state.get('max_tokens', 4000):,}")
+        st.write(f"• Temperature: {config.temperature}")
+        st.write(f"• Max Tokens: {config.max_tokens:,}")
         
         # 시스템 프롬프트
-        system_prompt = st.session_state.get('system_prompt', '')
         st.write("**📝 System Prompt:**")
-        if system_prompt:
-            st.write(f"• 설정됨 ({len(system_prompt)}자)")
+        if config.system_prompt:
+            st.write(f"• 설정됨 ({len(config.system_prompt)}자)")
         else:
             st.write("• 없음")